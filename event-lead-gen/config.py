@@ -1,5 +1,6 @@
 """Configuration management for event lead generation."""
 
+import functools
 import os
 
 # Load environment variables (dotenv is optional)
@@ -14,11 +15,30 @@ except ImportError:
 # =============================================================================
 
 APOLLO_API_KEY = os.getenv("APOLLO_API_KEY", "")
+# Local cache of Apollo matches (set to empty string to disable)
+APOLLO_CACHE_PATH = os.path.expanduser(os.getenv(
+    "APOLLO_CACHE_PATH",
+    "~/.cache/event-lead-gen/apollo.sqlite"
+))
 GOOGLE_CREDENTIALS_PATH = os.getenv(
     "GOOGLE_CREDENTIALS_PATH",
     "/Users/abhinavgaur/Desktop/announcement_scraper/config/google-credentials.json"
 )
 
+# =============================================================================
+# SCRAPER CACHE
+# =============================================================================
+
+# Directory for cached speaker pages (set to empty string to disable)
+SCRAPER_CACHE_DIR = os.path.expanduser(os.getenv(
+    "SCRAPER_CACHE_DIR",
+    "~/.cache/event-lead-gen"
+))
+SCRAPER_CACHE_TTL = 7 * 24 * 3600  # Seconds
+
+# Re-render pages instead of reading cached renders (fresh ones are still stored)
+SCRAPER_CACHE_REFRESH = os.getenv("SCRAPER_CACHE_REFRESH", "").lower() in ("1", "true", "yes")
+
 # =============================================================================
 # VALIDATION
 # =============================================================================
@@ -27,6 +47,7 @@ def validate_apollo_config() -> bool:
     """Check if Apollo API is configured."""
     return bool(APOLLO_API_KEY)
 
+@functools.lru_cache(maxsize=1)
 def validate_google_config() -> bool:
     """Check if Google credentials exist."""
     return os.path.exists(GOOGLE_CREDENTIALS_PATH)
@@ -10,10 +10,12 @@ Usage:
 import argparse
 import logging
 import sys
-import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional
 
 from output.sheets import (
-    get_sheets_client,
+    a1_range,
+    open_spreadsheet,
     read_speakers_from_worksheet,
     update_existing_worksheet
 )
@@ -23,6 +25,11 @@ from config import validate_apollo_config
 # Spreadsheet ID
 SPREADSHEET_ID = "1cGwhcZjMpz34BwSAGDZhytey8VZlBjLgzZ8WNmkLDKo"
 
+# Parallel worksheet reads when the batched read is unavailable
+SCAN_WORKERS = 8
+# Worksheets enriched concurrently by --all
+ENRICH_WORKERS = 3
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s | %(levelname)-8s | %(message)s",
@@ -31,40 +38,116 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _column_letter(idx: int) -> str:
+    """Convert a 0-based column index to an A1 column letter (0 -> A)."""
+    letters = ""
+    idx += 1
+    while idx:
+        idx, rem = divmod(idx - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+def _scan_worksheet(title: str, first_col: list[str], email_col: list[str]) -> Optional[dict]:
+    """
+    Return enrichment stats for a worksheet if it needs enrichment.
+
+    Both columns include the header cell. The API drops trailing blank cells,
+    so rows are counted from whichever column is longer.
+    """
+    row_count = max(len(first_col), len(email_col)) - 1
+    if row_count < 1:
+        return None
+
+    # Count filled cells in the Email column (list.count runs in C)
+    emails = email_col[1:]
+    emails_filled = len(emails) - emails.count("")
+
+    # If less than 10% have emails, needs enrichment
+    if emails_filled < row_count * 0.1:
+        return {
+            "name": title,
+            "speakers": row_count,
+            "emails": emails_filled
+        }
+    return None
+
+
+def _read_worksheet(ws) -> Optional[tuple[list[str], list[str]]]:
+    """Read the first and Email columns of one worksheet (None if no Email column)."""
+    try:
+        headers = ws.row_values(1)
+        if "Email" not in headers:
+            return None
+        return ws.col_values(1), ws.col_values(headers.index("Email") + 1)
+    except Exception as e:
+        logger.warning(f"Error checking {ws.title}: {e}")
+        return None
+
+
+def _batch_read_columns(spreadsheet, titles: list[str]) -> dict[str, tuple[list[str], list[str]]]:
+    """Read the first and Email columns of every worksheet in two batched requests."""
+    # Header rows first, to locate the Email column in each worksheet
+    header_ranges = spreadsheet.values_batch_get(
+        [a1_range(title, "1:1") for title in titles]
+    ).get("valueRanges", [])
+
+    email_cols = {}
+    for title, value_range in zip(titles, header_ranges):
+        headers = (value_range.get("values") or [[]])[0]
+        if "Email" in headers:
+            email_cols[title] = _column_letter(headers.index("Email"))
+
+    if not email_cols:
+        return {}
+
+    # Then only the two columns we need, returned column-major
+    ranges = []
+    for title, letter in email_cols.items():
+        ranges.append(a1_range(title, "A:A"))
+        ranges.append(a1_range(title, f"{letter}:{letter}"))
+    value_ranges = spreadsheet.values_batch_get(
+        ranges, params={"majorDimension": "COLUMNS"}
+    ).get("valueRanges", [])
+
+    def _col(value_range: dict) -> list[str]:
+        return (value_range.get("values") or [[]])[0]
+
+    return {
+        title: (_col(value_ranges[2 * i]), _col(value_ranges[2 * i + 1]))
+        for i, title in enumerate(email_cols)
+    }
+
+
 def get_worksheets_needing_enrichment():
     """Find worksheets with speakers but no emails."""
-    client = get_sheets_client()
-    spreadsheet = client.open_by_key(SPREADSHEET_ID)
+    spreadsheet = open_spreadsheet(SPREADSHEET_ID)
+
+    worksheets = spreadsheet.worksheets()
+    if not worksheets:
+        return []
+    titles = [ws.title for ws in worksheets]
+
+    try:
+        columns = _batch_read_columns(spreadsheet, titles)
+    except Exception as e:
+        # Fall back to reading worksheets individually, in parallel
+        logger.warning(f"Batch read failed ({e}), scanning worksheets individually...")
+        with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+            results = executor.map(_read_worksheet, worksheets)
+            columns = {title: cols for title, cols in zip(titles, results) if cols}
 
     needs_enrichment = []
-
-    for ws in spreadsheet.worksheets():
+    for title in titles:
+        if title not in columns:
+            continue
         try:
-            vals = ws.get_all_values()
-            row_count = len(vals) - 1 if vals else 0
-            if row_count < 1:
-                continue
-
-            headers = vals[0]
-            email_idx = headers.index("Email") if "Email" in headers else -1
-
-            if email_idx < 0:
-                continue
-
-            emails_filled = 0
-            for row in vals[1:]:
-                if len(row) > email_idx and row[email_idx]:
-                    emails_filled += 1
-
-            # If less than 10% have emails, needs enrichment
-            if emails_filled < row_count * 0.1:
-                needs_enrichment.append({
-                    "name": ws.title,
-                    "speakers": row_count,
-                    "emails": emails_filled
-                })
+            result = _scan_worksheet(title, *columns[title])
         except Exception as e:
-            logger.warning(f"Error checking {ws.title}: {e}")
+            logger.warning(f"Error checking {title}: {e}")
+            continue
+        if result:
+            needs_enrichment.append(result)
 
     return needs_enrichment
 
@@ -83,14 +166,14 @@ def enrich_worksheet(worksheet_name: str) -> int:
 
     # Count already enriched
     already_enriched = sum(1 for s in speakers if s.email)
-    logger.info(f"Already have emails for {already_enriched}/{len(speakers)} speakers")
+    logger.info(f"[{worksheet_name}] Already have emails for {already_enriched}/{len(speakers)} speakers")
 
     # Enrich with Apollo
     speakers = enrich_speakers(speakers)
 
     # Count new enrichment
     now_enriched = sum(1 for s in speakers if s.email)
-    logger.info(f"After enrichment: {now_enriched}/{len(speakers)} speakers have emails")
+    logger.info(f"[{worksheet_name}] After enrichment: {now_enriched}/{len(speakers)} speakers have emails")
 
     # Update worksheet
     update_existing_worksheet(speakers, SPREADSHEET_ID, worksheet_name, worksheet_name)
@@ -121,19 +204,19 @@ def main():
         worksheets = get_worksheets_needing_enrichment()
         print(f"\nFound {len(worksheets)} worksheets needing enrichment")
 
-        for ws in worksheets:
-            print(f"\n{'='*60}")
-            print(f"Processing: {ws['name']} ({ws['speakers']} speakers)")
-            print('='*60)
-
-            try:
-                new_emails = enrich_worksheet(ws['name'])
-                print(f"Added {new_emails} new emails")
-            except Exception as e:
-                logger.error(f"Failed to enrich {ws['name']}: {e}")
-
-            # Rate limit between worksheets
-            time.sleep(2)
+        # Worksheets share the Apollo rate limiter, so their Sheets I/O can overlap
+        with ThreadPoolExecutor(max_workers=ENRICH_WORKERS) as executor:
+            futures = {
+                executor.submit(enrich_worksheet, ws["name"]): ws
+                for ws in worksheets
+            }
+            for future in as_completed(futures):
+                ws = futures[future]
+                try:
+                    new_emails = future.result()
+                    print(f"{ws['name']} ({ws['speakers']} speakers): added {new_emails} new emails")
+                except Exception as e:
+                    logger.error(f"Failed to enrich {ws['name']}: {e}")
 
         print("\nDone!")
         return
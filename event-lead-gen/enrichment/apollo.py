@@ -1,19 +1,126 @@
 """Apollo.io People Enrichment API integration."""
 
 import logging
+import random
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from config import APOLLO_API_KEY
+# orjson is optional; fall back to stdlib json for payload serialization
+try:
+    import orjson
+
+    def _dumps(payload) -> bytes:
+        return orjson.dumps(payload)
+except ImportError:
+    import json
+
+    def _dumps(payload) -> bytes:
+        return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+from config import APOLLO_API_KEY, APOLLO_CACHE_PATH
+from enrichment.cache import EnrichmentCache
 from models import Speaker
 
 logger = logging.getLogger(__name__)
 
 APOLLO_BULK_MATCH_URL = "https://api.apollo.io/v1/people/bulk_match"
 BATCH_SIZE = 10  # Apollo allows up to 10 per request
-RATE_LIMIT_DELAY = 3.0  # Seconds between batches (avoid rate limits)
+RATE_LIMIT_PER_MINUTE = 20  # Client-side cap on Apollo requests per minute
+MAX_CONCURRENCY = 5  # Batches in flight at once
+
+# Retry policy for throttling / transient gateway errors
+RETRY_STATUSES = (429, 502, 503, 504)
+MAX_RETRIES = 5
+BACKOFF_BASE = 1.0  # Seconds, doubled each attempt
+BACKOFF_CAP = 30.0  # Max seconds between attempts
+
+
+class RateLimiter:
+    """Thread-safe token bucket allowing max_requests per window_s seconds."""
+
+    def __init__(self, max_requests: int, window_s: float):
+        self.max_requests = max_requests
+        self.rate = max_requests / window_s
+        self.tokens = float(max_requests)
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.max_requests, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+
+    def acquire(self) -> None:
+        """Take one token, blocking until one is available."""
+        while True:
+            with self._lock:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def sync(self, headers) -> None:
+        """Resync the bucket with the rate-limit headers of an API response."""
+        remaining = headers.get("X-RateLimit-Remaining") or headers.get("x-minute-requests-left")
+        if remaining is None:
+            return
+        try:
+            remaining = float(remaining)
+        except ValueError:
+            return
+
+        with self._lock:
+            self._refill()
+            self.tokens = min(self.tokens, remaining)
+            if remaining <= 0:
+                # Quota exhausted: hold the bucket empty until the reset time
+                try:
+                    reset_in = float(headers.get("X-RateLimit-Reset", 0))
+                except ValueError:
+                    reset_in = 0
+                # Header may be an epoch timestamp or a delta in seconds
+                if reset_in > time.time():
+                    reset_in -= time.time()
+                if reset_in > 0:
+                    self.tokens = -reset_in * self.rate
+
+
+_limiter = RateLimiter(RATE_LIMIT_PER_MINUTE, 60.0)
+
+# Shared session: keeps the TLS connection to Apollo alive across batches
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    "Content-Type": "application/json",
+    "Cache-Control": "no-cache",
+    "x-api-key": APOLLO_API_KEY
+})
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=MAX_CONCURRENCY,
+    pool_maxsize=MAX_CONCURRENCY * 2,
+    max_retries=Retry(connect=3, backoff_factor=0.5)
+))
+_cache: Optional[EnrichmentCache] = None
+_cache_lock = threading.Lock()
+
+
+def _get_cache() -> Optional[EnrichmentCache]:
+    """Open the match cache on first use (None if disabled or unavailable)."""
+    global _cache
+    with _cache_lock:
+        if _cache is None and APOLLO_CACHE_PATH:
+            try:
+                _cache = EnrichmentCache(APOLLO_CACHE_PATH)
+            except Exception as e:
+                logger.warning(f"Apollo cache unavailable: {e}")
+    return _cache
 
 
 def enrich_speakers(speakers: list[Speaker]) -> list[Speaker]:
@@ -33,91 +140,117 @@ def enrich_speakers(speakers: list[Speaker]) -> list[Speaker]:
     if not speakers:
         return speakers
 
-    logger.info(f"Enriching {len(speakers)} speakers via Apollo...")
+    # Only look up speakers that don't have an email yet; results are
+    # written onto the shared Speaker objects, so no merge is needed
+    to_enrich = [s for s in speakers if not s.email]
+    if len(to_enrich) < len(speakers):
+        logger.info(f"Skipping {len(speakers) - len(to_enrich)} already-enriched speakers")
+    if not to_enrich:
+        return speakers
+
+    logger.info(f"Enriching {len(to_enrich)} speakers via Apollo...")
 
-    # Process in batches
-    enriched_count = 0
-    for i in range(0, len(speakers), BATCH_SIZE):
-        batch = speakers[i:i + BATCH_SIZE]
-        batch_num = (i // BATCH_SIZE) + 1
-        total_batches = (len(speakers) + BATCH_SIZE - 1) // BATCH_SIZE
+    # Serve previously matched speakers from the cache
+    cache = _get_cache()
+    if cache:
+        to_fetch = [s for s in to_enrich if not cache.apply(s)]
+        if len(to_fetch) < len(to_enrich):
+            logger.info(f"Cache hit for {len(to_enrich) - len(to_fetch)} speakers")
+    else:
+        to_fetch = to_enrich
 
-        logger.info(f"Processing batch {batch_num}/{total_batches}...")
+    # Process batches concurrently; spacing is handled by the shared rate limiter
+    batches = [to_fetch[i:i + BATCH_SIZE] for i in range(0, len(to_fetch), BATCH_SIZE)]
+    total_batches = len(batches)
 
+    def _process(batch_num: int, batch: list[Speaker]) -> None:
+        logger.info(f"Processing batch {batch_num}/{total_batches}...")
+        keys = [cache.key(s) for s in batch] if cache else []
         try:
-            _enrich_batch(batch)
-            enriched_count += sum(1 for s in batch if s.email)
+            matched = {id(s) for s in _enrich_batch(batch)}
+            # Only Apollo matches are cached; failures and misses are retried next run
+            for key, s in zip(keys, batch):
+                if id(s) in matched:
+                    cache.put(key, s)
         except Exception as e:
             logger.error(f"Error enriching batch {batch_num}: {e}")
 
-        # Rate limiting between batches
-        if i + BATCH_SIZE < len(speakers):
-            time.sleep(RATE_LIMIT_DELAY)
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENCY) as executor:
+        list(executor.map(_process, range(1, total_batches + 1), batches))
+
+    enriched_count = sum(1 for s in speakers if s.email)
 
     logger.info(f"Enrichment complete. Found emails for {enriched_count}/{len(speakers)} speakers.")
     return speakers
 
 
-def _enrich_batch(speakers: list[Speaker]) -> None:
-    """Enrich a single batch of speakers (up to 10)."""
-    # Build request payload
-    details = []
-    for speaker in speakers:
-        detail = {
-            "first_name": speaker.first_name or "",
-            "last_name": speaker.last_name or "",
+def _enrich_batch(speakers: list[Speaker]) -> list[Speaker]:
+    """
+    Enrich a single batch of speakers (up to 10).
+
+    Returns the speakers Apollo matched (empty if the request failed).
+    """
+    # Build request payload (empty fields are omitted to keep it small)
+    details = [
+        {
+            key: value
+            for key, value in (
+                ("first_name", speaker.first_name),
+                ("last_name", speaker.last_name),
+                ("organization_name", speaker.company),
+            )
+            if value
         }
-        if speaker.company:
-            detail["organization_name"] = speaker.company
-        details.append(detail)
+        for speaker in speakers
+    ]
 
     payload = {
         "reveal_personal_emails": True,
         "details": details
     }
 
-    headers = {
-        "Content-Type": "application/json",
-        "Cache-Control": "no-cache",
-        "x-api-key": APOLLO_API_KEY
-    }
+    body = _dumps(payload)
 
-    try:
-        response = requests.post(
-            APOLLO_BULK_MATCH_URL,
-            json=payload,
-            headers=headers,
-            timeout=30
-        )
-        response.raise_for_status()
-        data = response.json()
-    except requests.exceptions.HTTPError as e:
-        if response.status_code == 429:
-            logger.warning("Rate limited by Apollo. Waiting 60 seconds...")
-            time.sleep(60)
-            # Retry once
-            response = requests.post(
+    for attempt in range(MAX_RETRIES):
+        try:
+            _limiter.acquire()
+            response = _SESSION.post(
                 APOLLO_BULK_MATCH_URL,
-                json=payload,
-                headers=headers,
+                data=body,
                 timeout=30
             )
+            _limiter.sync(response.headers)
             response.raise_for_status()
             data = response.json()
-        else:
-            raise
-    except requests.RequestException as e:
-        logger.error(f"Apollo API request failed: {e}")
-        return
+            break
+        except requests.exceptions.HTTPError:
+            if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES - 1:
+                raise
+            delay = min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt) * random.uniform(0.8, 1.2)
+            try:
+                delay = min(BACKOFF_CAP, float(response.headers.get("Retry-After", delay)))
+            except ValueError:
+                pass
+            logger.warning(
+                f"Apollo returned {response.status_code}. "
+                f"Retrying in {delay:.1f}s ({attempt + 1}/{MAX_RETRIES})..."
+            )
+            time.sleep(delay)
+        except requests.RequestException as e:
+            logger.error(f"Apollo API request failed: {e}")
+            return []
 
     # Parse results and update speakers
     matches = data.get("matches", [])
+    matched = []
 
     for i, match in enumerate(matches):
         if i >= len(speakers):
             break
 
         if match:
+            matched.append(speakers[i])
+
             # Extract email (prefer work email, then personal)
             email = match.get("email")
             if not email:
@@ -139,6 +272,8 @@ def _enrich_batch(speakers: list[Speaker]) -> None:
             if match.get("last_name"):
                 speakers[i].last_name = match.get("last_name")
 
+    return matched
+
 
 def enrich_single_speaker(speaker: Speaker) -> Speaker:
     """
@@ -0,0 +1,84 @@
+"""On-disk cache of Apollo match results."""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from models import Speaker
+
+logger = logging.getLogger(__name__)
+
+CACHE_TTL = 30 * 24 * 3600  # Seconds before a cached match is considered stale
+
+
+class EnrichmentCache:
+    """SQLite-backed cache keyed by normalized (first_name, last_name, company)."""
+
+    def __init__(self, path: str, ttl: float = CACHE_TTL):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS matches ("
+            "key TEXT PRIMARY KEY, email TEXT, linkedin_url TEXT, "
+            "first_name TEXT, last_name TEXT, ts REAL)"
+        )
+        self._conn.commit()
+        self.purge_expired()
+
+    @staticmethod
+    def key(speaker: Speaker) -> str:
+        """Build the normalized cache key for a speaker."""
+        parts = (speaker.first_name, speaker.last_name, speaker.company)
+        return "|".join((p or "").strip().lower() for p in parts)
+
+    def get(self, key: str) -> Optional[tuple]:
+        """Return (email, linkedin_url, first_name, last_name) or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT email, linkedin_url, first_name, last_name, ts FROM matches WHERE key = ?",
+                (key,)
+            ).fetchone()
+        if not row or time.time() - row[4] > self.ttl:
+            return None
+        return row[:4]
+
+    def put(self, key: str, speaker: Speaker) -> None:
+        """Store the enrichment result for a speaker."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO matches VALUES (?, ?, ?, ?, ?, ?)",
+                (key, speaker.email, speaker.linkedin_url,
+                 speaker.first_name, speaker.last_name, time.time())
+            )
+            self._conn.commit()
+
+    def apply(self, speaker: Speaker) -> bool:
+        """Fill a speaker from the cache. Returns True on a hit."""
+        hit = self.get(self.key(speaker))
+        if not hit:
+            return False
+
+        email, linkedin_url, first_name, last_name = hit
+        if email:
+            speaker.email = email
+        if linkedin_url:
+            speaker.linkedin_url = linkedin_url
+        if first_name:
+            speaker.first_name = first_name
+        if last_name:
+            speaker.last_name = last_name
+        return True
+
+    def purge_expired(self) -> None:
+        """Delete entries older than the TTL."""
+        with self._lock:
+            self._conn.execute("DELETE FROM matches WHERE ts < ?", (time.time() - self.ttl,))
+            self._conn.commit()
@@ -17,6 +17,7 @@ Usage:
 import argparse
 import csv
 import logging
+import re
 import sys
 from urllib.parse import urlparse
 
@@ -34,6 +35,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Path segments that never name the event
+_EVENT_NAME_STOPWORDS = frozenset({"speakers", "speaker", "schedule", "agenda"})
+_SEPARATOR_RE = re.compile(r"[-_]")
+
 
 def extract_event_name(url: str) -> str:
     """Extract a reasonable event name from URL."""
@@ -44,9 +49,9 @@ def extract_event_name(url: str) -> str:
     if path_parts:
         # Skip common words like 'speakers', 'speaker'
         for part in path_parts:
-            if part.lower() not in ["speakers", "speaker", "schedule", "agenda"]:
+            if part.lower() not in _EVENT_NAME_STOPWORDS:
                 # Clean up and title case
-                name = part.replace("-", " ").replace("_", " ").title()
+                name = _SEPARATOR_RE.sub(" ", part).title()
                 return name
 
     # Fall back to domain name
@@ -62,12 +67,11 @@ def export_to_csv(speakers: list[Speaker], filename: str, source_event: str) ->
         "Company Name", "LinkedIn URL", "Source Event"
     ]
 
-    with open(filename, "w", newline="", encoding="utf-8") as f:
+    with open(filename, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
         writer = csv.writer(f)
         writer.writerow(headers)
-
-        for speaker in speakers:
-            writer.writerow([
+        writer.writerows(
+            (
                 speaker.first_name or "",
                 speaker.last_name or "",
                 speaker.email or "",
@@ -75,25 +79,23 @@ def export_to_csv(speakers: list[Speaker], filename: str, source_event: str) ->
                 speaker.company or "",
                 speaker.linkedin_url or "",
                 source_event
-            ])
+            )
+            for speaker in speakers
+        )
 
     logger.info(f"Exported {len(speakers)} speakers to {filename}")
 
 
 def print_speakers_table(speakers: list[Speaker]) -> None:
     """Print speakers in a formatted table."""
-    print("\n" + "=" * 80)
-    print(f"{'Name':<25} {'Title':<30} {'Company':<20}")
-    print("=" * 80)
-
-    for speaker in speakers:
-        name = (speaker.name or "")[:24]
-        title = (speaker.title or "")[:29]
-        company = (speaker.company or "")[:19]
-        print(f"{name:<25} {title:<30} {company:<20}")
-
-    print("=" * 80)
-    print(f"Total: {len(speakers)} speakers\n")
+    # Build the whole table and write it once instead of one print per row
+    lines = ["", "=" * 80, f"{'Name':<25} {'Title':<30} {'Company':<20}", "=" * 80]
+    lines.extend(
+        f"{(s.name or '')[:24]:<25} {(s.title or '')[:29]:<30} {(s.company or '')[:19]:<20}"
+        for s in speakers
+    )
+    lines.extend(["=" * 80, f"Total: {len(speakers)} speakers", ""])
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
@@ -1,6 +1,7 @@
 """Data models for event lead generation."""
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Optional
 from datetime import datetime, timezone
 
@@ -19,16 +20,18 @@ class Speaker:
     # Enrichment fields (populated by Apollo)
     email: Optional[str] = None
     linkedin_url: Optional[str] = None
-    first_name: Optional[str] = None
-    last_name: Optional[str] = None
 
     # Metadata
     extracted_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
 
-    def __post_init__(self):
-        """Parse first/last name from full name if not provided."""
-        if self.name and not self.first_name:
-            parts = self.name.strip().split()
-            if parts:
-                self.first_name = parts[0]
-                self.last_name = " ".join(parts[1:]) if len(parts) > 1 else ""
+    # first_name / last_name are parsed from the full name on first access
+    # (assigning either one, e.g. from Apollo, overrides the parsed value)
+    @cached_property
+    def first_name(self) -> Optional[str]:
+        parts = self.name.split() if self.name else []
+        return parts[0] if parts else None
+
+    @cached_property
+    def last_name(self) -> Optional[str]:
+        parts = self.name.split() if self.name else []
+        return " ".join(parts[1:]) if parts else None
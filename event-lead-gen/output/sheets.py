@@ -1,13 +1,25 @@
 """Google Sheets export for HubSpot-ready speaker data."""
 
+import functools
+import itertools
 import logging
-from typing import Optional
+import operator
+import re
+from typing import Iterable, Iterator, Optional
 
 from config import GOOGLE_CREDENTIALS_PATH
 from models import Speaker
 
 logger = logging.getLogger(__name__)
 
+# Google dependencies are optional until a Sheets export is requested
+try:
+    import gspread
+    from google.oauth2.service_account import Credentials
+    GSPREAD_AVAILABLE = True
+except ImportError:
+    GSPREAD_AVAILABLE = False
+
 # HubSpot-compatible column headers
 HEADERS = [
     "First Name",
@@ -20,13 +32,93 @@ HEADERS = [
     "Source Event"
 ]
 
+# Speaker attributes in HEADERS order (Source Event is appended per row)
+_ROW_FIELDS = operator.attrgetter(
+    "first_name", "last_name", "email", "title",
+    "company", "linkedin_url", "twitter_url"
+)
+
+# Columns read back by read_speakers_from_worksheet, in unpacking order
+_READ_COLUMNS = (
+    "First Name", "Last Name", "Email", "Job Title",
+    "Company Name", "LinkedIn URL", "Twitter URL"
+)
+
+# Rows per Sheets API write request (keeps payloads under API size limits)
+WRITE_CHUNK_SIZE = 1000
+
+# Runs of whitespace (including newlines, carriage returns and tabs)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def a1_range(worksheet_name: str, cells: str = "A1") -> str:
+    """Build an A1 range string with a properly quoted worksheet name."""
+    escaped = worksheet_name.replace("'", "''")
+    return f"'{escaped}'!{cells}"
+
 
+def _chunks(rows: Iterable[list[str]], size: int) -> Iterator[list[list[str]]]:
+    """Group rows into lists of at most size rows."""
+    buf = []
+    for row in rows:
+        buf.append(row)
+        if len(buf) >= size:
+            yield buf
+            buf = []
+    if buf:
+        yield buf
+
+
+def _append_in_chunks(sheet, rows: Iterable[list[str]]) -> None:
+    """Append rows after existing data, one request per WRITE_CHUNK_SIZE rows."""
+    for chunk in _chunks(rows, WRITE_CHUNK_SIZE):
+        sheet.append_rows(chunk)
+
+
+def _row_data(values: list[list[str]]) -> list[dict]:
+    """Convert rows of strings to Sheets API RowData for updateCells requests."""
+    return [
+        {"values": [{"userEnteredValue": {"stringValue": v}} for v in row]}
+        for row in values
+    ]
+
+
+def _batch_write(
+    spreadsheet,
+    sheet_id: int,
+    rows: Iterable[list[str]],
+    requests: list[dict]
+) -> None:
+    """
+    Write rows from A1 with batch_update, one request per WRITE_CHUNK_SIZE rows.
+
+    The given structural requests (clear, resize, ...) travel with the first
+    chunk, so small sheets take a single round-trip.
+    """
+    row_index = 0
+    for chunk in _chunks(rows, WRITE_CHUNK_SIZE):
+        requests.append({"updateCells": {
+            "start": {"sheetId": sheet_id, "rowIndex": row_index, "columnIndex": 0},
+            "rows": _row_data(chunk),
+            "fields": "userEnteredValue",
+        }})
+        spreadsheet.batch_update({"requests": requests})
+        requests = []
+        row_index += len(chunk)
+    if requests:
+        spreadsheet.batch_update({"requests": requests})
+
+
+@functools.lru_cache(maxsize=1)
 def get_sheets_client():
-    """Get authenticated Google Sheets client."""
-    try:
-        import gspread
-        from google.oauth2.service_account import Credentials
-    except ImportError:
+    """
+    Get authenticated Google Sheets client.
+
+    The client is created once per process and shared by every caller
+    (including worker threads); call get_sheets_client.cache_clear() to
+    force re-authentication.
+    """
+    if not GSPREAD_AVAILABLE:
         raise ImportError(
             "gspread not installed. Run: pip install gspread google-auth"
         )
@@ -44,40 +136,59 @@ def get_sheets_client():
     return gspread.authorize(credentials)
 
 
-def sanitize_for_sheets(text) -> str:
-    """Sanitize any value for Google Sheets."""
-    if text is None:
-        return ""
-    text = str(text)
-    # Replace newlines, tabs, carriage returns with spaces
-    text = text.replace("\n", " ").replace("\r", " ").replace("\t", " ")
-    # Remove multiple spaces
-    text = " ".join(text.split())
+@functools.lru_cache(maxsize=None)
+def open_spreadsheet(spreadsheet_id: str):
+    """
+    Open a spreadsheet by ID, reusing the handle across calls.
+
+    Worksheet lookups on the handle still fetch fresh metadata, so caching
+    only skips the repeated open_by_key metadata request.
+    """
+    return get_sheets_client().open_by_key(spreadsheet_id)
+
+
+@functools.lru_cache(maxsize=1024)
+def _sanitize_str(text: str) -> str:
+    # Collapse newlines, tabs and repeated spaces into single spaces; skipped
+    # when there is nothing to collapse (isprintable() rules out any
+    # whitespace other than plain spaces)
+    if "  " in text or text[:1] == " " or text[-1:] == " " or not text.isprintable():
+        text = _WHITESPACE_RE.sub(" ", text).strip()
     # Limit length
     if len(text) > 500:
         text = text[:500]
     return text
 
 
+def sanitize_for_sheets(text) -> str:
+    """
+    Sanitize any value for Google Sheets.
+
+    Repeated values (companies, titles) are served from a small LRU cache.
+    """
+    if text is None or text == "":
+        return ""
+    if not isinstance(text, str):
+        text = str(text)
+    return _sanitize_str(text)
+
+
+def iter_speaker_rows(
+    speakers: Iterable[Speaker],
+    source_event: str
+) -> Iterator[list[str]]:
+    """Yield speakers as rows for Google Sheets."""
+    source = sanitize_for_sheets(source_event)
+    for speaker in speakers:
+        yield [sanitize_for_sheets(value) for value in _ROW_FIELDS(speaker)] + [source]
+
+
 def format_speakers_for_sheets(
     speakers: list[Speaker],
     source_event: str
 ) -> list[list[str]]:
     """Format speakers as rows for Google Sheets."""
-    rows = []
-    for speaker in speakers:
-        row = [
-            sanitize_for_sheets(speaker.first_name),
-            sanitize_for_sheets(speaker.last_name),
-            sanitize_for_sheets(speaker.email),
-            sanitize_for_sheets(speaker.title),
-            sanitize_for_sheets(speaker.company),
-            sanitize_for_sheets(speaker.linkedin_url),
-            sanitize_for_sheets(speaker.twitter_url),
-            sanitize_for_sheets(source_event),
-        ]
-        rows.append(row)
-    return rows
+    return list(iter_speaker_rows(speakers, source_event))
 
 
 def export_to_sheet(
@@ -96,8 +207,6 @@ def export_to_sheet(
     Returns:
         Number of speakers exported
     """
-    import gspread
-
     if not speakers:
         logger.info("No speakers to export")
         return 0
@@ -120,17 +229,18 @@ def export_to_sheet(
         logger.error(f"Failed to create spreadsheet: {e}")
         raise
 
-    # Get the first worksheet
-    sheet = spreadsheet.sheet1
-    sheet.update_title("Speakers")
-
-    # Add headers
-    sheet.append_row(HEADERS)
-
-    # Format and add speaker rows
-    rows = format_speakers_for_sheets(speakers, source_event)
-    if rows:
-        sheet.append_rows(rows)
+    # Rename and size the default first worksheet (always sheetId 0 in a new
+    # spreadsheet) in the same request as the headers and first speaker rows
+    requests = [{"updateSheetProperties": {
+        "properties": {
+            "sheetId": 0,
+            "title": "Speakers",
+            "gridProperties": {"rowCount": len(speakers) + 1},
+        },
+        "fields": "title,gridProperties.rowCount",
+    }}]
+    rows = iter_speaker_rows(speakers, source_event)
+    _batch_write(spreadsheet, 0, itertools.chain([HEADERS], rows), requests)
 
     # Make spreadsheet accessible
     try:
@@ -163,8 +273,6 @@ def export_to_existing_sheet(
     Returns:
         Number of speakers exported
     """
-    import gspread
-
     if not speakers:
         logger.info("No speakers to export")
         return 0
@@ -174,29 +282,32 @@ def export_to_existing_sheet(
     logger.info(f"Adding worksheet '{worksheet_name}' to existing spreadsheet...")
 
     try:
-        client = get_sheets_client()
-        spreadsheet = client.open_by_key(spreadsheet_id)
+        spreadsheet = open_spreadsheet(spreadsheet_id)
     except Exception as e:
         logger.error(f"Failed to open spreadsheet: {e}")
         raise
 
+    rows = iter_speaker_rows(speakers, source_event)
+
     # Create new worksheet or get existing
     try:
         sheet = spreadsheet.worksheet(worksheet_name)
         logger.info(f"Worksheet '{worksheet_name}' already exists, appending...")
+        _append_in_chunks(sheet, rows)
     except gspread.WorksheetNotFound:
-        sheet = spreadsheet.add_worksheet(
-            title=worksheet_name,
-            rows=max(1000, len(speakers) + 100),
-            cols=len(HEADERS)
-        )
-        # Add headers for new sheet
-        sheet.append_row(HEADERS)
-
-    # Format and add speaker rows
-    rows = format_speakers_for_sheets(speakers, source_event)
-    if rows:
-        sheet.append_rows(rows)
+        # Create the worksheet (sized exactly; later appends grow it as needed)
+        # and write headers + speaker rows in the same request. The sheetId is
+        # chosen here, clear of the existing tabs, so the data requests can
+        # reference the new sheet.
+        metadata = spreadsheet.fetch_sheet_metadata()
+        existing_ids = [s["properties"]["sheetId"] for s in metadata.get("sheets", [])]
+        sheet_id = max(existing_ids, default=0) + 1
+        requests = [{"addSheet": {"properties": {
+            "sheetId": sheet_id,
+            "title": worksheet_name,
+            "gridProperties": {"rowCount": len(speakers) + 1, "columnCount": len(HEADERS)},
+        }}}]
+        _batch_write(spreadsheet, sheet_id, itertools.chain([HEADERS], rows), requests)
 
     logger.info(f"Exported {len(speakers)} speakers to worksheet '{worksheet_name}'")
     print(f"\nGoogle Sheet URL: {spreadsheet.url}")
@@ -222,8 +333,6 @@ def update_existing_worksheet(
     Returns:
         Number of speakers exported
     """
-    import gspread
-
     if not speakers:
         logger.info("No speakers to export")
         return 0
@@ -233,8 +342,7 @@ def update_existing_worksheet(
     logger.info(f"Updating worksheet '{worksheet_name}'...")
 
     try:
-        client = get_sheets_client()
-        spreadsheet = client.open_by_key(spreadsheet_id)
+        spreadsheet = open_spreadsheet(spreadsheet_id)
     except Exception as e:
         logger.error(f"Failed to open spreadsheet: {e}")
         raise
@@ -246,16 +354,20 @@ def update_existing_worksheet(
         logger.error(f"Worksheet '{worksheet_name}' not found")
         raise
 
-    # Clear existing data
-    sheet.clear()
-
-    # Add headers
-    sheet.append_row(HEADERS)
-
-    # Format and add speaker rows
-    rows = format_speakers_for_sheets(speakers, source_event)
-    if rows:
-        sheet.append_rows(rows)
+    # Clear existing values and write headers + speaker rows; the first
+    # request carries the clear, so small sheets take a single round-trip
+    total_rows = len(speakers) + 1
+    requests = [
+        {"updateCells": {"range": {"sheetId": sheet.id}, "fields": "userEnteredValue"}},
+    ]
+    if total_rows > sheet.row_count:
+        requests.append({"appendDimension": {
+            "sheetId": sheet.id,
+            "dimension": "ROWS",
+            "length": total_rows - sheet.row_count,
+        }})
+    values = itertools.chain([HEADERS], iter_speaker_rows(speakers, source_event))
+    _batch_write(spreadsheet, sheet.id, values, requests)
 
     logger.info(f"Updated {len(speakers)} speakers in worksheet '{worksheet_name}'")
 
@@ -276,11 +388,8 @@ def read_speakers_from_worksheet(
     Returns:
         List of Speaker objects
     """
-    import gspread
-
     try:
-        client = get_sheets_client()
-        spreadsheet = client.open_by_key(spreadsheet_id)
+        spreadsheet = open_spreadsheet(spreadsheet_id)
         sheet = spreadsheet.worksheet(worksheet_name)
     except Exception as e:
         logger.error(f"Failed to open worksheet: {e}")
@@ -294,20 +403,20 @@ def read_speakers_from_worksheet(
     headers = values[0]
     speakers = []
 
-    # Find column indices
+    # Resolve column indices once (None for columns the sheet doesn't have)
     col_map = {h: i for i, h in enumerate(headers)}
+    indices = tuple(col_map.get(h) for h in _READ_COLUMNS)
+
+    def _cell(row: list[str], i: Optional[int]) -> str:
+        return row[i] if i is not None and i < len(row) else ""
 
     for row in values[1:]:
         if not row or not any(row):
             continue
 
-        first_name = row[col_map.get("First Name", 0)] if col_map.get("First Name") is not None and len(row) > col_map.get("First Name", 0) else ""
-        last_name = row[col_map.get("Last Name", 1)] if col_map.get("Last Name") is not None and len(row) > col_map.get("Last Name", 1) else ""
-        email = row[col_map.get("Email", 2)] if col_map.get("Email") is not None and len(row) > col_map.get("Email", 2) else ""
-        title = row[col_map.get("Job Title", 3)] if col_map.get("Job Title") is not None and len(row) > col_map.get("Job Title", 3) else ""
-        company = row[col_map.get("Company Name", 4)] if col_map.get("Company Name") is not None and len(row) > col_map.get("Company Name", 4) else ""
-        linkedin = row[col_map.get("LinkedIn URL", 5)] if col_map.get("LinkedIn URL") is not None and len(row) > col_map.get("LinkedIn URL", 5) else ""
-        twitter = row[col_map.get("Twitter URL", 6)] if col_map.get("Twitter URL") is not None and len(row) > col_map.get("Twitter URL", 6) else ""
+        first_name, last_name, email, title, company, linkedin, twitter = (
+            _cell(row, i) for i in indices
+        )
 
         name = f"{first_name} {last_name}".strip()
 
@@ -0,0 +1,136 @@
+"""Shared headless Chromium for Playwright-based scrapers."""
+
+import atexit
+import logging
+from contextlib import contextmanager
+from typing import Iterator
+
+logger = logging.getLogger(__name__)
+
+try:
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+    from playwright.sync_api import sync_playwright
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_AVAILABLE = False
+
+# Resource types that never carry speaker data (CSS stays: it decides visibility)
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+
+_SCROLL_AND_COUNT_JS = """sel => {
+    window.scrollTo(0, document.body.scrollHeight);
+    return document.querySelectorAll(sel).length;
+}"""
+_COUNT_JS = "sel => document.querySelectorAll(sel).length"
+_GREW_JS = "([sel, n]) => document.querySelectorAll(sel).length > n"
+
+_playwright = None
+_browser = None
+
+
+def _shutdown() -> None:
+    global _playwright, _browser
+    if _browser is not None:
+        try:
+            _browser.close()
+        except Exception:
+            pass
+        _browser = None
+    if _playwright is not None:
+        try:
+            _playwright.stop()
+        except Exception:
+            pass
+        _playwright = None
+
+
+def get_browser():
+    """Launch Chromium on first use and reuse it for the rest of the process."""
+    global _playwright, _browser
+    if _browser is None:
+        _playwright = sync_playwright().start()
+        _browser = _playwright.chromium.launch(
+            headless=True,
+            args=["--disable-gpu", "--no-sandbox", "--disable-dev-shm-usage"]
+        )
+        atexit.register(_shutdown)
+    return _browser
+
+
+def _block_resources(route) -> None:
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
+
+@contextmanager
+def page_context(block_resources: bool = False) -> Iterator:
+    """
+    Yield a fresh page in its own browser context on the shared browser.
+
+    With block_resources, requests for BLOCKED_RESOURCE_TYPES are aborted; only
+    pass it for scrapers checked to find the same cards without them.
+    """
+    context = get_browser().new_context()
+    try:
+        page = context.new_page()
+        if block_resources:
+            page.route("**/*", _block_resources)
+        yield page
+    finally:
+        context.close()
+
+
+def wait_for_idle(page, timeout: float = 30000) -> bool:
+    """Wait for the network to go idle; False if it is still busy after timeout ms."""
+    try:
+        page.wait_for_load_state("networkidle", timeout=timeout)
+        return True
+    except PlaywrightTimeoutError:
+        return False
+
+
+def wait_for_match(page, selector: str, timeout: float = 10000) -> bool:
+    """Wait for selector to match; False if nothing matches within timeout ms."""
+    try:
+        page.wait_for_selector(selector, state="attached", timeout=timeout)
+        return True
+    except PlaywrightTimeoutError:
+        return False
+
+
+def scroll_until_stable(
+    page,
+    selector: str,
+    max_iters: int = 30,
+    quiet_rounds: int = 2,
+    timeout: float = 3000
+) -> int:
+    """
+    Scroll to the bottom until no new elements matching selector appear.
+
+    Each scroll waits (up to timeout ms) for the match count to grow and
+    returns as soon as it does; after quiet_rounds scrolls without growth
+    the page is considered fully loaded. Returns the final match count.
+    """
+    quiet = 0
+    for i in range(max_iters):
+        # Scroll and count in one round-trip
+        count = page.evaluate(_SCROLL_AND_COUNT_JS, selector)
+        try:
+            page.wait_for_function(
+                _GREW_JS,
+                arg=[selector, count],
+                timeout=timeout
+            )
+            quiet = 0
+        except PlaywrightTimeoutError:
+            quiet += 1
+            if quiet >= quiet_rounds:
+                break
+
+        if i > 0 and i % 10 == 0:
+            logger.info(f"  Scrolled {i} times, {count} elements found...")
+
+    return page.evaluate(_COUNT_JS, selector)
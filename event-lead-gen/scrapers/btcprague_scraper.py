@@ -2,21 +2,23 @@
 
 import logging
 import re
-import time
 from typing import Optional
 
-import requests
 from bs4 import BeautifulSoup
 
 from models import Speaker
+from scrapers.browser import PLAYWRIGHT_AVAILABLE, page_context, scroll_until_stable
+from scrapers.fetch import fetch_all, load_cached_html, store_cached_html
+from scrapers.social import extract_social_links
 
 logger = logging.getLogger(__name__)
 
-try:
-    from playwright.sync_api import sync_playwright
-    PLAYWRIGHT_AVAILABLE = True
-except ImportError:
-    PLAYWRIGHT_AVAILABLE = False
+_SPEAKER_LINK_RE = re.compile(r"btcprague\.com/speakers/[^/]+")
+_CARD_CLASS_RE = re.compile(r"b-cream|speaker|card")
+_FEATURED_CLASS_RE = re.compile(r"h2|heading")
+
+# Link texts that are UI elements (cookie popups etc.), not speakers
+_SKIP_PATTERNS = ("manage", "cookie", "vendor", "options", "services", "privacy", "consent")
 
 
 def scrape_btcprague_speakers(url: str) -> list[Speaker]:
@@ -28,37 +30,36 @@ def scrape_btcprague_speakers(url: str) -> list[Speaker]:
     logger.info(f"Scraping BTC Prague speakers from: {url}")
 
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            page.goto(url, wait_until="networkidle", timeout=60000)
+        html = load_cached_html(url)
+        if html is None:
+            with page_context() as page:
+                page.goto(url, wait_until="networkidle", timeout=60000)
 
-            # Scroll to load all content
-            for i in range(25):
-                page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                time.sleep(0.8)
+                # Scroll until no new content loads
+                count = scroll_until_stable(page, 'a[href*="/speakers/"]', max_iters=25)
 
-            html = page.content()
-            browser.close()
+                html = page.content()
+            # Don't cache challenge pages or empty shells
+            if count:
+                store_cached_html(url, html)
 
     except Exception as e:
         logger.error(f"Failed to load page: {e}")
         return []
 
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, "lxml")
 
-    # Find speaker links and cards
-    speaker_data = []
-    seen_urls = set()
+    # Find speaker links and cards, keyed by lowercased name (insertion-ordered)
+    by_name = {}
+    seen_urls = set()  # Profile URLs already claimed by an accepted name
 
     # Pattern 1: Links to individual speaker pages
-    for link in soup.find_all("a", href=re.compile(r"btcprague\.com/speakers/[^/]+")):
+    for link in soup.find_all("a", href=_SPEAKER_LINK_RE):
         href = link.get("href", "")
         title = link.get("title", "")
 
-        if not href or href in seen_urls or "/speakers/page/" in href:
+        if not href or "/speakers/page/" in href:
             continue
-        seen_urls.add(href)
 
         # Get the name from title attribute or link text
         name = title or link.get_text(strip=True)
@@ -66,58 +67,72 @@ def scrape_btcprague_speakers(url: str) -> list[Speaker]:
             continue
 
         # Skip non-speaker entries (cookie popups, UI elements)
-        skip_patterns = ["manage", "cookie", "vendor", "options", "services", "privacy", "consent"]
-        if any(p in name.lower() for p in skip_patterns):
+        name_lower = name.lower()
+        if any(p in name_lower for p in _SKIP_PATTERNS):
+            continue
+
+        # Same speaker linked more than once: merge into the first entry
+        key = name_lower.strip()
+        existing = by_name.get(key)
+
+        # Another link to an already-named profile ("Read more", "View profile")
+        if not existing and href in seen_urls:
             continue
 
         # Try to find role in parent card
         role = ""
-        card = link.find_parent("div", class_=re.compile(r"b-cream|speaker|card"))
+        card = link.find_parent("div", class_=_CARD_CLASS_RE)
         if card:
             role_elem = card.find("div", class_="fs-xs")
             if role_elem:
                 role = role_elem.get_text(strip=True)
 
         # Find social links in card
-        twitter_url = None
-        linkedin_url = None
-        if card:
-            for a in card.find_all("a", href=True):
-                h = a.get("href", "")
-                if "twitter.com" in h or "x.com" in h:
-                    twitter_url = h
-                elif "linkedin.com" in h:
-                    linkedin_url = h
-
-        speaker_data.append({
+        twitter_url, linkedin_url = extract_social_links(card) if card else (None, None)
+
+        if existing:
+            existing["title"] = existing["title"] or role
+            existing["twitter"] = existing["twitter"] or twitter_url
+            existing["linkedin"] = existing["linkedin"] or linkedin_url
+            continue
+
+        by_name[key] = {
             "name": name,
             "title": role,
             "url": href,
             "twitter": twitter_url,
             "linkedin": linkedin_url
-        })
+        }
+        seen_urls.add(href)
 
     # Also check for featured speaker (Michael Saylor style card)
-    featured = soup.find("h1", class_=re.compile(r"h2|heading"))
+    featured = soup.find("h1", class_=_FEATURED_CLASS_RE)
     if featured:
         name = featured.get_text(strip=True)
-        if name and name not in [s["name"] for s in speaker_data]:
+        if name and name.lower() not in by_name:
             # Find role
             role_div = featured.find_next("div")
             role = role_div.get_text(strip=True) if role_div else ""
 
-            speaker_data.append({
+            by_name[name.lower()] = {
                 "name": name,
                 "title": role,
                 "url": url,
                 "twitter": None,
                 "linkedin": None
-            })
+            }
 
+    speaker_data = list(by_name.values())
     logger.info(f"Found {len(speaker_data)} speakers from page")
 
-    # If we found speaker URLs, scrape individual pages for more details
-    headers = {"User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"}
+    # Scrape individual pages (concurrently) only for speakers whose card
+    # lacked a role or any social link
+    detail_urls = {
+        data["url"] for data in speaker_data
+        if data["url"] and data["url"] != url
+        and (not data["title"] or (not data["twitter"] and not data["linkedin"]))
+    }
+    detail_pages = dict(fetch_all(detail_urls, timeout=10))
     speakers = []
 
     for data in speaker_data:
@@ -127,32 +142,29 @@ def scrape_btcprague_speakers(url: str) -> list[Speaker]:
         linkedin_url = data["linkedin"]
 
         # Try to get more details from individual page
-        if data["url"] and data["url"] != url:
+        page_html = detail_pages.get(data["url"])
+        if page_html:
             try:
-                r = requests.get(data["url"], headers=headers, timeout=10)
-                if r.status_code == 200:
-                    page_soup = BeautifulSoup(r.text, "html.parser")
-
-                    # Get title from page if not already found
-                    if not title:
-                        title_div = page_soup.find("div", class_="fs-xs")
-                        if not title_div:
-                            # Look for text after H1
-                            h1 = page_soup.find("h1")
-                            if h1:
-                                next_div = h1.find_next("div")
-                                if next_div:
-                                    title = next_div.get_text(strip=True)
-                        else:
-                            title = title_div.get_text(strip=True)
-
-                    # Get social links if not found
-                    for a in page_soup.find_all("a", href=True):
-                        h = a.get("href", "")
-                        if not twitter_url and ("twitter.com" in h or "x.com" in h):
-                            twitter_url = h
-                        elif not linkedin_url and "linkedin.com" in h:
-                            linkedin_url = h
+                page_soup = BeautifulSoup(page_html, "lxml")
+
+                # Get title from page if not already found
+                if not title:
+                    title_div = page_soup.find("div", class_="fs-xs")
+                    if not title_div:
+                        # Look for text after H1
+                        h1 = page_soup.find("h1")
+                        if h1:
+                            next_div = h1.find_next("div")
+                            if next_div:
+                                title = next_div.get_text(strip=True)
+                    else:
+                        title = title_div.get_text(strip=True)
+
+                # Get social links if not found
+                if not twitter_url or not linkedin_url:
+                    page_twitter, page_linkedin = extract_social_links(page_soup)
+                    twitter_url = twitter_url or page_twitter
+                    linkedin_url = linkedin_url or page_linkedin
 
             except Exception:
                 pass
@@ -2,21 +2,24 @@
 
 import logging
 import re
-import time
+from html import unescape
 from typing import Optional
+from urllib.parse import urljoin
 
-import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from models import Speaker
+from scrapers.browser import PLAYWRIGHT_AVAILABLE, page_context, scroll_until_stable
+from scrapers.fetch import fetch_all, load_cached_html, store_cached_html
+from scrapers.social import extract_social_links
 
 logger = logging.getLogger(__name__)
 
-try:
-    from playwright.sync_api import sync_playwright
-    PLAYWRIGHT_AVAILABLE = True
-except ImportError:
-    PLAYWRIGHT_AVAILABLE = False
+# Speaker links: /agenda/speaker/-name or /speaker/-name
+_SPEAKER_HREF_RE = re.compile(r'href="([^"]*/(?:agenda/)?speaker/-[^"]*)"')
+
+# Only these parts of the detail pages are read, so the parser can skip the rest
+_DETAIL_STRAINER = SoupStrainer(["h1", "h2", "a"])
 
 
 def scrape_consensus_speakers(url: str) -> list[Speaker]:
@@ -34,34 +37,22 @@ def scrape_consensus_speakers(url: str) -> list[Speaker]:
     logger.info(f"Scraping Consensus speakers from: {url}")
 
     # First get all speaker URLs from the main page using Playwright
-    speaker_urls = set()
-
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            page.goto(url, wait_until="networkidle", timeout=60000)
-
-            # Scroll to load all speakers
-            for i in range(40):
-                page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                time.sleep(0.8)
-
-            html = page.content()
-            browser.close()
-
-        soup = BeautifulSoup(html, "html.parser")
-
-        # Find speaker links - pattern: /agenda/speaker/-name or /speaker/-name
-        for link in soup.find_all("a", href=re.compile(r"/(?:agenda/)?speaker/-")):
-            href = link.get("href", "")
-            if href:
-                # Make absolute URL
-                if href.startswith("/"):
-                    from urllib.parse import urlparse
-                    parsed = urlparse(url)
-                    href = f"{parsed.scheme}://{parsed.netloc}{href}"
-                speaker_urls.add(href)
+        html = load_cached_html(url)
+        if html is None:
+            with page_context() as page:
+                page.goto(url, wait_until="networkidle", timeout=60000)
+
+                # Scroll until no new speakers load
+                count = scroll_until_stable(page, 'a[href*="/speaker/-"]', max_iters=40)
+
+                html = page.content()
+            # Don't cache challenge pages or empty shells
+            if count:
+                store_cached_html(url, html)
+
+        # Find speaker links with a plain string scan (no DOM needed)
+        speaker_urls = {urljoin(url, unescape(href)) for href in _SPEAKER_HREF_RE.findall(html)}
 
         logger.info(f"Found {len(speaker_urls)} speaker URLs")
 
@@ -72,22 +63,18 @@ def scrape_consensus_speakers(url: str) -> list[Speaker]:
     if not speaker_urls:
         return []
 
-    # Scrape each speaker page
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-    }
+    # Scrape speaker pages concurrently
     speakers = []
 
-    for i, speaker_url in enumerate(speaker_urls):
+    for i, (speaker_url, page_html) in enumerate(fetch_all(speaker_urls, timeout=15)):
         if i > 0 and i % 20 == 0:
             logger.info(f"Scraped {i}/{len(speaker_urls)} speakers...")
 
-        try:
-            r = requests.get(speaker_url, headers=headers, timeout=15)
-            if r.status_code != 200:
-                continue
+        if page_html is None:
+            continue
 
-            page_soup = BeautifulSoup(r.text, "html.parser")
+        try:
+            page_soup = BeautifulSoup(page_html, "lxml", parse_only=_DETAIL_STRAINER)
 
             # H1 = Name
             h1 = page_soup.find("h1")
@@ -97,20 +84,13 @@ def scrape_consensus_speakers(url: str) -> list[Speaker]:
 
             # H2s = Title, Company
             h2s = page_soup.find_all("h2")
-            h2_texts = [h.get_text(strip=True) for h in h2s if h.get_text(strip=True)]
+            h2_texts = [t for t in (h.get_text(strip=True) for h in h2s) if t]
 
             title = h2_texts[0] if h2_texts else None
             company = h2_texts[1] if len(h2_texts) > 1 else None
 
             # Find social links
-            twitter_url = None
-            linkedin_url = None
-            for a in page_soup.find_all("a", href=True):
-                href = a.get("href", "")
-                if "twitter.com/" in href or "x.com/" in href:
-                    twitter_url = href
-                elif "linkedin.com/" in href:
-                    linkedin_url = href
+            twitter_url, linkedin_url = extract_social_links(page_soup)
 
             speakers.append(Speaker(
                 name=name,
@@ -1,20 +1,20 @@
 """Custom scraper for DC Blockchain Summit."""
 
 import logging
-import time
 from typing import Optional
 
 from bs4 import BeautifulSoup
 
 from models import Speaker
+from scrapers.browser import PLAYWRIGHT_AVAILABLE, page_context, scroll_until_stable
+from scrapers.fetch import load_cached_html, store_cached_html
+from scrapers.social import extract_social_links
 
 logger = logging.getLogger(__name__)
 
-try:
-    from playwright.sync_api import sync_playwright
-    PLAYWRIGHT_AVAILABLE = True
-except ImportError:
-    PLAYWRIGHT_AVAILABLE = False
+# A render is only cached if it parses to at least this many speakers; error
+# and interstitial pages have an h2 or two too
+MIN_CACHED_SPEAKERS = 3
 
 
 def scrape_dcblockchainsummit_speakers(url: str) -> list[Speaker]:
@@ -26,24 +26,22 @@ def scrape_dcblockchainsummit_speakers(url: str) -> list[Speaker]:
     logger.info(f"Scraping DC Blockchain Summit speakers from: {url}")
 
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            page.goto(url, wait_until="networkidle", timeout=60000)
+        html = load_cached_html(url)
+        rendered = html is None
+        if rendered:
+            with page_context() as page:
+                page.goto(url, wait_until="networkidle", timeout=60000)
 
-            # Scroll to load all content
-            for i in range(15):
-                page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                time.sleep(0.8)
+                # Scroll until no new content loads
+                scroll_until_stable(page, 'h2', max_iters=15)
 
-            html = page.content()
-            browser.close()
+                html = page.content()
 
     except Exception as e:
         logger.error(f"Failed to load page: {e}")
         return []
 
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, "lxml")
 
     # Find all H2 elements (speaker names)
     h2s = soup.find_all("h2")
@@ -69,15 +67,7 @@ def scrape_dcblockchainsummit_speakers(url: str) -> list[Speaker]:
                     break
 
         # Look for social links
-        twitter_url = None
-        linkedin_url = None
-        if parent:
-            for a in parent.find_all("a", href=True):
-                href = a.get("href", "")
-                if "twitter.com" in href or "x.com" in href:
-                    twitter_url = href
-                elif "linkedin.com" in href:
-                    linkedin_url = href
+        twitter_url, linkedin_url = extract_social_links(parent) if parent else (None, None)
 
         speakers.append(Speaker(
             name=name,
@@ -87,5 +77,9 @@ def scrape_dcblockchainsummit_speakers(url: str) -> list[Speaker]:
             source_url=url
         ))
 
+    # Don't cache challenge pages or empty shells
+    if rendered and len(speakers) >= MIN_CACHED_SPEAKERS:
+        store_cached_html(url, html)
+
     logger.info(f"Extracted {len(speakers)} speakers from DC Blockchain Summit")
     return speakers
@@ -2,21 +2,21 @@
 
 import logging
 import re
-import time
 from typing import Optional
 
-import requests
 from bs4 import BeautifulSoup
 
 from models import Speaker
+from scrapers.browser import PLAYWRIGHT_AVAILABLE, page_context, scroll_until_stable
+from scrapers.fetch import fetch_all, load_cached_html, store_cached_html
+from scrapers.social import extract_social_links
 
 logger = logging.getLogger(__name__)
 
-try:
-    from playwright.sync_api import sync_playwright
-    PLAYWRIGHT_AVAILABLE = True
-except ImportError:
-    PLAYWRIGHT_AVAILABLE = False
+_SPEAKER_URL_RE = re.compile(r'href="(https://ethdenver\.com/speakers/[^/"]+/)"')
+
+# Elementor headings on speaker pages that are not speaker details
+_SKIP_HEADINGS = frozenset({"other speakers", "venue:", "follow us:", "contributor agreement"})
 
 
 def scrape_ethdenver_speakers(url: str) -> list[Speaker]:
@@ -29,52 +29,42 @@ def scrape_ethdenver_speakers(url: str) -> list[Speaker]:
 
     # Use Playwright to scroll and load all speakers
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            page.goto(url, wait_until="networkidle", timeout=60000)
-
-            # Keep scrolling to load all speakers
-            last_count = 0
-            for i in range(50):
-                page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                time.sleep(2)
+        html = load_cached_html(url)
+        if html is None:
+            with page_context() as page:
+                page.goto(url, wait_until="networkidle", timeout=60000)
 
-                count = page.locator('a[href*="/speakers/"]').count()
-                if i > 0 and i % 10 == 0:
-                    logger.info(f"  Scrolled {i} times, {count} links found...")
+                # Keep scrolling until no new speaker links load
+                count = scroll_until_stable(page, 'a[href*="/speakers/"]', max_iters=50)
+                logger.info(f"  Loaded {count} speaker links")
 
-                if count == last_count and i > 5:
-                    break
-                last_count = count
-
-            html = page.content()
-            browser.close()
+                html = page.content()
+            # Don't cache challenge pages or empty shells
+            if count:
+                store_cached_html(url, html)
 
     except Exception as e:
         logger.error(f"Failed to load page: {e}")
         return []
 
     # Extract speaker URLs
-    speaker_urls = set(re.findall(r'href="(https://ethdenver\.com/speakers/[^/"]+/)"', html))
+    speaker_urls = set(_SPEAKER_URL_RE.findall(html))
     speaker_urls = [u for u in speaker_urls if "/feed/" not in u and "/page/" not in u]
 
     logger.info(f"Found {len(speaker_urls)} speaker URLs, scraping details...")
 
-    # Scrape each speaker page
-    headers = {"User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"}
+    # Scrape speaker pages concurrently
     speakers = []
 
-    for i, speaker_url in enumerate(speaker_urls):
+    for i, (speaker_url, page_html) in enumerate(fetch_all(speaker_urls, timeout=15)):
         if i > 0 and i % 50 == 0:
             logger.info(f"  Scraped {i}/{len(speaker_urls)} speakers...")
 
-        try:
-            r = requests.get(speaker_url, headers=headers, timeout=15)
-            if r.status_code != 200:
-                continue
+        if page_html is None:
+            continue
 
-            soup = BeautifulSoup(r.text, "html.parser")
+        try:
+            soup = BeautifulSoup(page_html, "lxml")
 
             # Find speaker info from Elementor heading widgets
             # Structure: 1st = Name, 2nd = Company, 3rd = Title
@@ -82,8 +72,7 @@ def scrape_ethdenver_speakers(url: str) -> list[Speaker]:
             heading_texts = [h.get_text(strip=True) for h in headings]
 
             # Filter out non-speaker headings
-            skip_texts = ["other speakers", "venue:", "follow us:", "contributor agreement"]
-            heading_texts = [h for h in heading_texts if h.lower() not in skip_texts and len(h) > 1]
+            heading_texts = [h for h in heading_texts if h.lower() not in _SKIP_HEADINGS and len(h) > 1]
 
             if not heading_texts:
                 continue
@@ -98,14 +87,7 @@ def scrape_ethdenver_speakers(url: str) -> list[Speaker]:
                 name = url_name.replace("-", " ").title()
 
             # Find social links
-            twitter_url = None
-            linkedin_url = None
-            for a in soup.find_all("a", href=True):
-                href = a.get("href", "")
-                if "twitter.com/" in href or "x.com/" in href:
-                    twitter_url = href
-                elif "linkedin.com/" in href:
-                    linkedin_url = href
+            twitter_url, linkedin_url = extract_social_links(soup)
 
             speakers.append(Speaker(
                 name=name,
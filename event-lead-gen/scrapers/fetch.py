@@ -0,0 +1,124 @@
+"""Shared HTTP fetching and page caching for speaker scrapers."""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Iterable, Iterator, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config import SCRAPER_CACHE_DIR, SCRAPER_CACHE_REFRESH, SCRAPER_CACHE_TTL
+
+logger = logging.getLogger(__name__)
+
+# requests-cache is optional; without it every run refetches pages
+try:
+    from requests_cache import CachedSession
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+}
+FETCH_WORKERS = 16  # Concurrent detail-page requests
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """Get the shared keep-alive session used by all scrapers."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            if SCRAPER_CACHE_DIR and REQUESTS_CACHE_AVAILABLE:
+                os.makedirs(SCRAPER_CACHE_DIR, exist_ok=True)
+                _session = CachedSession(
+                    os.path.join(SCRAPER_CACHE_DIR, "http.sqlite"),
+                    expire_after=timedelta(seconds=SCRAPER_CACHE_TTL),
+                    allowable_methods=["GET"]
+                )
+            else:
+                _session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=FETCH_WORKERS,
+                pool_maxsize=FETCH_WORKERS * 2,
+                max_retries=Retry(total=3, backoff_factor=0.3)
+            )
+            _session.mount("https://", adapter)
+            _session.mount("http://", adapter)
+    return _session
+
+
+def fetch_page(url: str, headers: Optional[dict] = None, timeout: float = 15) -> Optional[str]:
+    """Fetch a page, returning its HTML or None on error / non-200 status."""
+    try:
+        r = get_session().get(url, headers=headers or DEFAULT_HEADERS, timeout=timeout)
+    except requests.RequestException as e:
+        logger.debug(f"Failed to fetch {url}: {e}")
+        return None
+    if r.status_code != 200:
+        return None
+    return r.text
+
+
+def fetch_all(
+    urls: Iterable[str],
+    headers: Optional[dict] = None,
+    timeout: float = 15,
+    max_workers: int = FETCH_WORKERS
+) -> Iterator[tuple[str, Optional[str]]]:
+    """
+    Fetch pages concurrently.
+
+    Yields (url, html) pairs in input order; html is None for failed requests.
+    """
+    urls = list(urls)
+    if not urls:
+        return
+
+    def _fetch(url: str) -> tuple[str, Optional[str]]:
+        return url, fetch_page(url, headers, timeout)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+        yield from executor.map(_fetch, urls)
+
+
+def _html_cache_path(url: str) -> str:
+    return os.path.join(SCRAPER_CACHE_DIR, "html", hashlib.sha1(url.encode()).hexdigest() + ".html")
+
+
+def load_cached_html(url: str) -> Optional[str]:
+    """Return a previously rendered page for url if cached and not expired."""
+    if not SCRAPER_CACHE_DIR or SCRAPER_CACHE_REFRESH:
+        return None
+    path = _html_cache_path(url)
+    try:
+        if time.time() - os.path.getmtime(path) > SCRAPER_CACHE_TTL:
+            return None
+        with open(path, encoding="utf-8") as f:
+            html = f.read()
+    except OSError:
+        return None
+    logger.info(f"Using cached render of {url}")
+    return html
+
+
+def store_cached_html(url: str, html: str) -> None:
+    """Cache a rendered page (e.g. Playwright output) for url."""
+    if not SCRAPER_CACHE_DIR:
+        return
+    path = _html_cache_path(url)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(html)
+    except OSError as e:
+        logger.debug(f"Could not cache {url}: {e}")
@@ -1,46 +1,94 @@
 """Generic speaker scraper for event websites."""
 
+import functools
+import importlib
+import io
 import json
 import logging
 import re
-import time
-from typing import Optional
+from typing import Callable, Optional
 from urllib.parse import urlparse
 
 import requests
-from bs4 import BeautifulSoup
+import soupsieve
+from bs4 import BeautifulSoup, Tag
 
 from models import Speaker
+from scrapers.browser import PLAYWRIGHT_AVAILABLE, page_context, scroll_until_stable, wait_for_idle, wait_for_match
+from scrapers.fetch import fetch_all, get_session
+from scrapers.social import extract_social_links, pick_social_urls
 
 logger = logging.getLogger(__name__)
 
 # Check if Playwright is available
+if not PLAYWRIGHT_AVAILABLE:
+    logger.debug("Playwright not installed - JS-rendered sites with infinite scroll won't be fully supported")
+
+# lxml parses several times faster than the pure-Python html.parser
 try:
-    from playwright.sync_api import sync_playwright
-    PLAYWRIGHT_AVAILABLE = True
+    from lxml import etree
+    LXML_AVAILABLE = True
+    HTML_PARSER = "lxml"
 except ImportError:
-    PLAYWRIGHT_AVAILABLE = False
-    logger.debug("Playwright not installed - JS-rendered sites with infinite scroll won't be fully supported")
+    LXML_AVAILABLE = False
+    HTML_PARSER = "html.parser"
 
+# orjson is optional; fall back to stdlib json for __NEXT_DATA__ parsing
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Sitemap <loc> URLs: any entry (regex fallback without lxml), a nested
+# sitemap, and individual speaker pages (/agenda/speaker/... or /speaker/...)
+_SITEMAP_LOC_RE = re.compile(r'<loc>([^<]+)</loc>')
+_SITEMAP_INDEX_RE = re.compile(r'.sitemap.+\.xml$')
+_SITEMAP_SPEAKER_RE = re.compile(r'/speaker/.')
+
+# Company mentioned in a speaker page meta description ("... of/at/from Company")
+_META_COMPANY_RE = re.compile(r'(?:of|at|from)\s+([^,\.]+)')
+
+_NEXT_DATA_RE = re.compile(
+    rb'<script id="__NEXT_DATA__" type="application/json">(.*?)</script>',
+    re.DOTALL
+)
+
+# Speaker fields in Next.js React Server Component streamed data
+_DISPLAY_NAME_RE = re.compile(r'"displayName":"([^"]+)"')
+_ORG_RE = re.compile(r'"organization":"([^"]+)"')
+_SOCIAL_BLOCK_RE = re.compile(r'"socialProfiles":\[([^\]]*)\]')
+_SOCIAL_URL_RE = re.compile(r'"(https?://[^"]+)"')
+_STREAMED_FIELD_WINDOW = 2048  # Max chars after the last displayName to look for its fields
+
+# Company after the role in a title, tried in order
+_TITLE_COMPANY_RES = [
+    re.compile(r"(?:at|@)\s+(.+)$", re.IGNORECASE),  # "CEO at Company"
+    re.compile(r",\s+(.+)$"),                        # "CEO, Company"
+    re.compile(r"\|\s*(.+)$"),                       # "CEO | Company"
+    re.compile(r"-\s+(.+)$"),                        # "CEO - Company"
+]
+
+# Markers of a JS-rendered page ("react"/"firebase" in any case), found in one scan
+_JS_HEAVY_RE = re.compile(rb"__NEXT|(?i:react|firebase)")
 
-def _extract_social_links(card) -> tuple[Optional[str], Optional[str]]:
-    """Extract Twitter and LinkedIn URLs from a card element."""
-    twitter_url = None
-    linkedin_url = None
+# Elements counted to tell whether scrolling loaded more speakers
+_CARD_PROXY_SELECTOR = "img[src*='profile'], img[alt*='Profile'], img[alt*='Speaker'], .speaker-card, .speaker"
 
-    # Find all links in the card
-    links = card.find_all("a", href=True)
-    for link in links:
-        href = link.get("href", "")
-        if "twitter.com/" in href or "x.com/" in href:
-            twitter_url = href
-        elif "linkedin.com/" in href:
-            linkedin_url = href
+# WordPress archive pages requested concurrently per pagination batch
+WP_PAGE_BATCH = 10
 
-    return twitter_url, linkedin_url
+# Site-specific scrapers keyed by host suffix; modules are imported on first use
+_SITE_SCRAPERS = {
+    "coindesk.com": ("scrapers.consensus_scraper", "scrape_consensus_speakers"),
+    "dcblockchainsummit.com": ("scrapers.dcblockchainsummit_scraper", "scrape_dcblockchainsummit_speakers"),
+    "btcprague.com": ("scrapers.btcprague_scraper", "scrape_btcprague_speakers"),
+    "ethdenver.com": ("scrapers.ethdenver_scraper", "scrape_ethdenver_speakers"),
+    "web3hubdavos.com": ("scrapers.web3hubdavos_scraper", "scrape_web3hubdavos_speakers"),
+}
 
 
-def _scrape_with_playwright(url: str, scroll_pause: float = 1.0, max_scrolls: int = 50) -> list[Speaker]:
+def _scrape_with_playwright(url: str, max_scrolls: int = 50) -> list[Speaker]:
     """
     Use Playwright to scrape JS-rendered pages with infinite scroll.
     Extracts speaker data including social links.
@@ -53,70 +101,50 @@ def _scrape_with_playwright(url: str, scroll_pause: float = 1.0, max_scrolls: in
     speakers = []
 
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            page.goto(url, wait_until="networkidle", timeout=60000)
-
-            # Scroll to load all content - use image count as indicator
-            scroll_count = 0
-            last_card_count = 0
-            while scroll_count < max_scrolls:
-                page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                time.sleep(scroll_pause)
-
-                # Count profile images as proxy for loaded content
-                try:
-                    card_count = page.locator("img[src*='profile'], img[alt*='Profile'], img[alt*='Speaker'], .speaker-card, .speaker").count()
-                except Exception:
-                    card_count = 0
-
-                if card_count == last_card_count and scroll_count > 5:
-                    # No new content after multiple scrolls
-                    break
-                last_card_count = card_count
-                scroll_count += 1
+        # Fresh context on the shared browser (no per-call Chromium launch)
+        with page_context() as page:
+            page.goto(url, wait_until="domcontentloaded", timeout=60000)
 
-                if scroll_count % 10 == 0:
-                    logger.info(f"  Scrolled {scroll_count} times, {card_count} cards loaded...")
+            # Start as soon as the first card renders; layouts without the
+            # card proxy fall back to waiting for the network to settle
+            if not wait_for_match(page, _CARD_PROXY_SELECTOR):
+                wait_for_idle(page)
 
-            logger.info(f"Finished scrolling after {scroll_count} scrolls, {last_card_count} cards")
+            # Scroll until no new cards load - profile images are the proxy
+            # for loaded content; each scroll returns as soon as more appear
+            card_count = scroll_until_stable(page, _CARD_PROXY_SELECTOR, max_iters=max_scrolls)
+            logger.info(f"Finished scrolling, {card_count} cards")
 
             # Get the fully loaded HTML
             html = page.content()
-            browser.close()
-
-            soup = BeautifulSoup(html, "html.parser")
-
-            # Try EthCC-style cards first (directional-hover-card with profile photos)
-            cards = soup.find_all("div", class_=lambda x: x and "directional-hover-card" in x and "group" in x)
-            if cards:
-                logger.info(f"Found {len(cards)} EthCC-style speaker cards")
-                for card in cards:
-                    speaker = _extract_ethcc_speaker(card, url)
-                    if speaker:
-                        speakers.append(speaker)
-                if speakers:
-                    return _dedupe_speakers(speakers)
-
-            # Try to extract from Next.js streamed data
-            streamed = _extract_nextjs_streamed_speakers(html, url)
-            if streamed:
-                return streamed
-
-            # Fall back to standard DOM parsing
-            for selector in SPEAKER_SELECTORS:
-                found_cards = soup.select(selector)
-                if len(found_cards) >= 3:
-                    for card in found_cards:
-                        speaker = _extract_speaker_from_card(card, url)
-                        if speaker and speaker.name:
-                            twitter, linkedin = _extract_social_links(card)
-                            speaker.twitter_url = twitter
-                            if linkedin:
-                                speaker.linkedin_url = linkedin
-                            speakers.append(speaker)
-                    break
+
+        soup = BeautifulSoup(html, HTML_PARSER)
+
+        # Try EthCC-style cards first (directional-hover-card with profile photos)
+        cards = _ETHCC_CARD_SIEVE.select(soup)
+        if cards:
+            logger.info(f"Found {len(cards)} EthCC-style speaker cards")
+            for card in cards:
+                speaker = _extract_ethcc_speaker(card, url)
+                if speaker:
+                    speakers.append(speaker)
+            if speakers:
+                return _dedupe_speakers(speakers)
+
+        # Try to extract from Next.js streamed data
+        streamed = _extract_nextjs_streamed_speakers(html, url)
+        if streamed:
+            return streamed
+
+        # Fall back to standard DOM parsing
+        for card in _select_speaker_cards(soup, min_cards=3):
+            speaker = _extract_speaker_from_card(card, url)
+            if speaker and speaker.name:
+                twitter, linkedin = extract_social_links(card)
+                speaker.twitter_url = twitter
+                if linkedin:
+                    speaker.linkedin_url = linkedin
+                speakers.append(speaker)
 
     except Exception as e:
         logger.error(f"Playwright scraping failed: {e}")
@@ -146,14 +174,7 @@ def _extract_ethcc_speaker(card, source_url: str) -> Optional[Speaker]:
         company = text[idx:].strip()
 
     # Get social links
-    twitter_url = None
-    linkedin_url = None
-    for link in card.find_all("a", href=True):
-        href = link.get("href", "")
-        if "twitter.com" in href or "x.com" in href:
-            twitter_url = href.strip()
-        elif "linkedin.com" in href:
-            linkedin_url = href.strip()
+    twitter_url, linkedin_url = extract_social_links(card)
 
     return Speaker(
         name=name,
@@ -165,14 +186,11 @@ def _extract_ethcc_speaker(card, source_url: str) -> Optional[Speaker]:
 
 
 def _dedupe_speakers(speakers: list[Speaker]) -> list[Speaker]:
-    """Deduplicate speakers by name."""
-    seen = set()
-    unique = []
+    """Deduplicate speakers by name, keeping the first occurrence."""
+    by_name = {}
     for s in speakers:
-        key = s.name.lower().strip()
-        if key not in seen:
-            seen.add(key)
-            unique.append(s)
+        by_name.setdefault(s.name.lower().strip(), s)
+    unique = list(by_name.values())
     logger.info(f"Deduplicated to {len(unique)} unique speakers")
     return unique
 
@@ -184,40 +202,33 @@ def _extract_nextjs_streamed_speakers(html: str, url: str) -> list[Speaker]:
     """
     speakers = []
 
-    # Find displayName, organization, and socialProfiles patterns
-    # Pattern for speaker objects in streamed data
-    speaker_pattern = re.compile(
-        r'"displayName":"([^"]+)".*?"organization":"([^"]*)".*?"trackSlug":"([^"]*)".*?"socialProfiles":\[([^\]]*)\]',
-        re.DOTALL
-    )
-
-    # Also try simpler pattern if the above doesn't match well
-    name_matches = re.findall(r'"displayName":"([^"]+)"', html)
-    org_matches = re.findall(r'"organization":"([^"]+)"', html)
-    social_matches = re.findall(r'"socialProfiles":\[([^\]]*)\]', html)
-
+    # Each speaker object starts at its displayName; organization and
+    # socialProfiles follow it, so they are searched only between this
+    # displayName and the next one (the last one, which has no next, is
+    # capped at _STREAMED_FIELD_WINDOW chars)
+    name_matches = list(_DISPLAY_NAME_RE.finditer(html))
     if not name_matches:
         return []
 
     logger.info(f"Found {len(name_matches)} speakers in Next.js streamed data")
 
-    for i, name in enumerate(name_matches):
-        org = org_matches[i] if i < len(org_matches) else None
-        socials = social_matches[i] if i < len(social_matches) else ""
+    for i, match in enumerate(name_matches):
+        start = match.end()
+        if i + 1 < len(name_matches):
+            end = name_matches[i + 1].start()
+        else:
+            end = start + _STREAMED_FIELD_WINDOW
+
+        org_match = _ORG_RE.search(html, start, end)
+        social_match = _SOCIAL_BLOCK_RE.search(html, start, end)
+        socials = social_match.group(1) if social_match else ""
 
         # Parse social links
-        twitter_url = None
-        linkedin_url = None
-        social_links = re.findall(r'"(https?://[^"]+)"', socials)
-        for link in social_links:
-            if "twitter.com/" in link or "x.com/" in link:
-                twitter_url = link.strip()
-            elif "linkedin.com/" in link:
-                linkedin_url = link.strip()
+        twitter_url, linkedin_url = pick_social_urls(_SOCIAL_URL_RE.findall(socials))
 
         speakers.append(Speaker(
-            name=name,
-            company=org,
+            name=match.group(1),
+            company=org_match.group(1) if org_match else None,
             twitter_url=twitter_url,
             linkedin_url=linkedin_url,
             source_url=url
@@ -226,6 +237,51 @@ def _extract_nextjs_streamed_speakers(html: str, url: str) -> list[Speaker]:
     return speakers
 
 
+def _parse_wordpress_speaker_page(html: str, url: str) -> Optional[Speaker]:
+    """Extract a speaker from an individual WordPress speaker page."""
+    soup = BeautifulSoup(html, HTML_PARSER)
+
+    # Try to find name from H1 or title
+    h1 = soup.find("h1")
+    name = h1.get_text(strip=True) if h1 else None
+    if not name:
+        title_tag = soup.find("title")
+        if title_tag:
+            name = title_tag.get_text(strip=True).split(" - ")[0].strip()
+
+    if not name or len(name) < 2:
+        return None
+
+    # Try to find title/company from various elements
+    title = None
+    company = None
+
+    # Look for common WordPress speaker meta patterns
+    for selector in _WP_TITLE_SIEVES:
+        elem = selector.select_one(soup)
+        if elem:
+            title = elem.get_text(strip=True)
+            break
+
+    for selector in _WP_COMPANY_SIEVES:
+        elem = selector.select_one(soup)
+        if elem:
+            company = elem.get_text(strip=True)
+            break
+
+    # Find social links
+    twitter_url, linkedin_url = extract_social_links(soup)
+
+    return Speaker(
+        name=name,
+        title=title,
+        company=company,
+        twitter_url=twitter_url,
+        linkedin_url=linkedin_url,
+        source_url=url
+    )
+
+
 def _extract_wordpress_paginated_speakers(base_url: str, headers: dict) -> list[Speaker]:
     """Extract speakers from WordPress sites with paginated speaker archive pages."""
     speakers = []
@@ -237,189 +293,179 @@ def _extract_wordpress_paginated_speakers(base_url: str, headers: dict) -> list[
 
     logger.info(f"Checking for WordPress pagination at {base_url}")
 
-    for page in range(1, 50):  # Max 50 pages
-        if page == 1:
-            page_url = base_url
-        else:
-            page_url = f"{parsed.scheme}://{parsed.netloc}{base_path}/page/{page}/"
+    # Individual speaker pages directly under the archive path
+    speaker_link_re = re.compile(
+        rf'href="({re.escape(f"{parsed.scheme}://{parsed.netloc}{base_path}")}/[^/]+/)"'
+    )
 
-        try:
-            r = requests.get(page_url, headers=headers, timeout=30, allow_redirects=True)
-            if r.status_code != 200:
+    # Max 50 pages, fetched WP_PAGE_BATCH at a time; the first failed page or
+    # page without new speakers ends the walk (later pages in its batch are ignored)
+    page_urls = [base_url] + [
+        f"{parsed.scheme}://{parsed.netloc}{base_path}/page/{page}/" for page in range(2, 50)
+    ]
+    for start in range(0, len(page_urls), WP_PAGE_BATCH):
+        batch = page_urls[start:start + WP_PAGE_BATCH]
+        exhausted = False
+        for page, (page_url, page_html) in enumerate(fetch_all(batch, headers=headers, timeout=30), start + 1):
+            if page_html is None:
+                exhausted = True
                 break
-        except requests.RequestException:
-            break
 
-        # Find individual speaker page URLs
-        matches = re.findall(rf'href="({parsed.scheme}://{parsed.netloc}{base_path}/[^/]+/)"', r.text)
-        new_urls = set(matches) - speaker_urls
-        if not new_urls:
-            break  # No new speakers found
-        speaker_urls.update(new_urls)
-        logger.info(f"Page {page}: {len(new_urls)} new speakers (total: {len(speaker_urls)})")
+            # Find individual speaker page URLs
+            matches = speaker_link_re.findall(page_html)
+            new_urls = set(matches) - speaker_urls
+            if not new_urls:
+                exhausted = True
+                break  # No new speakers found
+            speaker_urls.update(new_urls)
+            logger.info(f"Page {page}: {len(new_urls)} new speakers (total: {len(speaker_urls)})")
+        if exhausted:
+            break
 
     if not speaker_urls:
         return []
 
     logger.info(f"Found {len(speaker_urls)} speaker pages, scraping...")
 
-    # Scrape individual speaker pages
-    for i, url in enumerate(speaker_urls):
+    # Scrape individual speaker pages concurrently
+    for i, (url, page_html) in enumerate(fetch_all(speaker_urls, headers=headers, timeout=15)):
         if i > 0 and i % 20 == 0:
             logger.info(f"  Scraped {i}/{len(speaker_urls)} speakers...")
 
-        try:
-            r = requests.get(url, headers=headers, timeout=15)
-            if r.status_code != 200:
-                continue
-
-            soup = BeautifulSoup(r.text, "html.parser")
+        if page_html is None:
+            continue
 
-            # Try to find name from H1 or title
-            h1 = soup.find("h1")
-            name = h1.get_text(strip=True) if h1 else None
-            if not name:
-                title_tag = soup.find("title")
-                if title_tag:
-                    name = title_tag.get_text(strip=True).split(" - ")[0].strip()
+        speaker = _parse_wordpress_speaker_page(page_html, url)
+        if speaker:
+            speakers.append(speaker)
 
-            if not name or len(name) < 2:
-                continue
+    return speakers
 
-            # Try to find title/company from various elements
-            title = None
-            company = None
 
-            # Look for common WordPress speaker meta patterns
-            for selector in [".speaker-title", ".job-title", ".position", ".role"]:
-                elem = soup.select_one(selector)
-                if elem:
-                    title = elem.get_text(strip=True)
-                    break
-
-            for selector in [".speaker-company", ".company", ".organization"]:
-                elem = soup.select_one(selector)
-                if elem:
-                    company = elem.get_text(strip=True)
-                    break
+def _declared_encoding(response: requests.Response) -> Optional[str]:
+    """Charset from the Content-Type header, or None to let the parser detect it."""
+    if "charset" in response.headers.get("Content-Type", "").lower():
+        return response.encoding
+    return None
 
-            # Find social links
-            twitter_url = None
-            linkedin_url = None
-            for link in soup.find_all("a", href=True):
-                href = link.get("href", "")
-                if "twitter.com/" in href or "x.com/" in href:
-                    twitter_url = href
-                elif "linkedin.com/" in href:
-                    linkedin_url = href
-
-            speakers.append(Speaker(
-                name=name,
-                title=title,
-                company=company,
-                twitter_url=twitter_url,
-                linkedin_url=linkedin_url,
-                source_url=url
-            ))
 
-        except requests.RequestException:
-            continue
+def _sitemap_locs(content: bytes) -> list[str]:
+    """
+    Return the <loc> URLs of a sitemap or sitemap index.
 
-    return speakers
+    With lxml the document is streamed: each <url>/<sitemap> entry is freed
+    once read, so memory stays flat on sitemaps with tens of thousands of URLs.
+    """
+    if LXML_AVAILABLE:
+        locs = []
+        try:
+            for _, elem in etree.iterparse(
+                io.BytesIO(content),
+                events=("end",),
+                tag=("{*}loc", "{*}url", "{*}sitemap")
+            ):
+                if etree.QName(elem).localname == "loc":
+                    if elem.text:
+                        locs.append(elem.text.strip())
+                    continue
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+            return locs
+        except etree.XMLSyntaxError:
+            pass
+    return _SITEMAP_LOC_RE.findall(content.decode("utf-8", errors="replace"))
 
 
 def _extract_sitemap_speakers(base_url: str, headers: dict) -> list[Speaker]:
     """Extract speakers from sitemap (for JS-rendered sites like Coindesk events)."""
     parsed = urlparse(base_url)
     sitemap_url = f"{parsed.scheme}://{parsed.netloc}/sitemap.xml"
+    session = get_session()
 
     try:
-        r = requests.get(sitemap_url, headers=headers, timeout=30)
+        r = session.get(sitemap_url, headers=headers, timeout=30)
         if r.status_code != 200:
             return []
     except requests.RequestException:
         return []
 
+    locs = _sitemap_locs(r.content)
+
     # Find sitemap index
-    sitemap_match = re.search(r'<loc>([^<]+sitemap[^<]+\.xml)</loc>', r.text)
-    if sitemap_match:
-        sitemap_url = sitemap_match.group(1)
+    sitemap_url = next((loc for loc in locs if _SITEMAP_INDEX_RE.search(loc)), None)
+    if sitemap_url:
         try:
-            r = requests.get(sitemap_url, headers=headers, timeout=30)
+            r = session.get(sitemap_url, headers=headers, timeout=30)
         except requests.RequestException:
             return []
+        locs = _sitemap_locs(r.content)
 
-    # Find speaker page URLs (pattern: /agenda/speaker/ or /speaker/)
-    speaker_urls = re.findall(r'<loc>([^<]*/(?:agenda/)?speaker/[^<]+)</loc>', r.text)
-    # Filter out non-individual pages
-    speaker_urls = [u for u in speaker_urls if u.count('/') > 4]
+    # Find speaker page URLs, filtering out non-individual pages
+    speaker_urls = [u for u in locs if _SITEMAP_SPEAKER_RE.search(u) and u.count('/') > 4]
 
     if not speaker_urls:
         return []
 
     logger.info(f"Found {len(speaker_urls)} speaker pages in sitemap, scraping...")
 
+    # Fetch speaker pages concurrently
     speakers = []
-    for i, url in enumerate(speaker_urls):
+    for i, (url, page_html) in enumerate(fetch_all(speaker_urls, headers=headers, timeout=15)):
         if i > 0 and i % 50 == 0:
             logger.info(f"  Scraped {i}/{len(speaker_urls)} speakers...")
 
-        try:
-            resp = requests.get(url, headers=headers, timeout=15)
-            if resp.status_code != 200:
-                continue
+        if page_html is None:
+            continue
 
-            soup = BeautifulSoup(resp.text, "html.parser")
+        soup = BeautifulSoup(page_html, HTML_PARSER)
 
-            # Extract name from H1
-            h1 = soup.find("h1")
-            if not h1:
-                continue
-            name = h1.get_text(strip=True)
-            if not name or len(name) < 2:
-                continue
+        # Extract name from H1
+        h1 = soup.find("h1")
+        if not h1:
+            continue
+        name = h1.get_text(strip=True)
+        if not name or len(name) < 2:
+            continue
 
-            # Extract title and company from H2 elements
-            h2s = soup.find_all("h2")
-            h2_texts = [h.get_text(strip=True) for h in h2s if h.get_text(strip=True)]
-
-            title = h2_texts[0] if h2_texts else None
-            company = h2_texts[1] if len(h2_texts) > 1 else None
-
-            # Fallback: extract company from meta description
-            if not company:
-                meta = soup.find("meta", {"name": "description"})
-                if meta:
-                    desc = meta.get("content", "")
-                    match = re.search(r'(?:of|at|from)\s+([^,\.]+)', desc)
-                    if match:
-                        company = match.group(1).strip()
-
-            speakers.append(Speaker(
-                name=name,
-                title=title,
-                company=company,
-                source_url=url
-            ))
+        # Extract title and company from H2 elements
+        h2s = soup.find_all("h2")
+        h2_texts = [t for t in (h.get_text(strip=True) for h in h2s) if t]
 
-        except requests.RequestException:
-            continue
+        title = h2_texts[0] if h2_texts else None
+        company = h2_texts[1] if len(h2_texts) > 1 else None
+
+        # Fallback: extract company from meta description
+        if not company:
+            meta = soup.find("meta", {"name": "description"})
+            if meta:
+                desc = meta.get("content", "")
+                match = _META_COMPANY_RE.search(desc)
+                if match:
+                    company = match.group(1).strip()
+
+        speakers.append(Speaker(
+            name=name,
+            title=title,
+            company=company,
+            source_url=url
+        ))
 
     return speakers
 
 
-def _extract_nextjs_speakers(html: str, url: str) -> list[Speaker]:
-    """Extract speakers from Next.js __NEXT_DATA__ JSON."""
-    match = re.search(
-        r'<script id="__NEXT_DATA__" type="application/json">(.*?)</script>',
-        html,
-        re.DOTALL
-    )
+def _extract_nextjs_speakers(html: bytes, url: str) -> list[Speaker]:
+    """Extract speakers from Next.js __NEXT_DATA__ JSON in the raw page bytes."""
+    # Cheap substring probe before the DOTALL regex scan (most pages aren't Next.js)
+    if b"__NEXT_DATA__" not in html:
+        return []
+
+    match = _NEXT_DATA_RE.search(html)
     if not match:
         return []
 
     try:
-        data = json.loads(match.group(1))
+        data = _loads(match.group(1))
         props = data.get("props", {}).get("pageProps", {})
     except json.JSONDecodeError:
         return []
@@ -521,6 +567,73 @@ COMPANY_SELECTORS = [
     "[class*='organization']",
 ]
 
+# Selectors compiled once (soupsieve otherwise re-parses them on every call)
+_SPEAKER_SIEVES = [soupsieve.compile(s) for s in SPEAKER_SELECTORS]
+_SPEAKER_UNION_SIEVE = soupsieve.compile(", ".join(SPEAKER_SELECTORS))
+_WP_TITLE_SIEVES = [soupsieve.compile(s) for s in (".speaker-title", ".job-title", ".position", ".role")]
+_WP_COMPANY_SIEVES = [soupsieve.compile(s) for s in (".speaker-company", ".company", ".organization")]
+_TEXT_WIDGET_SIEVE = soupsieve.compile(".elementor-widget-text-editor")
+# Substring match on the class attribute, as the old class_ lambda did
+_ETHCC_CARD_SIEVE = soupsieve.compile('div[class*="directional-hover-card"][class*="group"]')
+
+
+def _select_speaker_cards(soup, min_cards: int = 1) -> list:
+    """
+    Return the cards of the first SPEAKER_SELECTORS entry with at least min_cards matches.
+
+    The page is traversed once with the union of all selectors; the matches
+    are then grouped by selector in priority order.
+    """
+    matches = _SPEAKER_UNION_SIEVE.select(soup)
+    if len(matches) < min_cards:
+        return []
+    for selector in _SPEAKER_SIEVES:
+        cards = [el for el in matches if selector.match(el)]
+        if len(cards) >= min_cards:
+            logger.debug(f"Found {len(cards)} elements with selector: {selector.pattern}")
+            return cards
+    return []
+
+
+def _simple_matcher(selector: str) -> Callable[[str, list, str], bool]:
+    """
+    Turn a ".class", "tag" or "[class*='x']" selector into a predicate.
+
+    The predicate takes (tag name, class list, joined class string), so a
+    single walk over a card can test every selector per element.
+    """
+    if selector.startswith("[class*="):
+        value = selector[len("[class*="):-1].strip("'\"")
+        return lambda tag, classes, class_str: value in class_str
+    if selector.startswith("."):
+        value = selector[1:]
+        return lambda tag, classes, class_str: value in classes
+    return lambda tag, classes, class_str: tag == selector
+
+
+_NAME_MATCHERS = [_simple_matcher(s) for s in NAME_SELECTORS]
+_TITLE_MATCHERS = [_simple_matcher(s) for s in TITLE_SELECTORS]
+_COMPANY_MATCHERS = [_simple_matcher(s) for s in COMPANY_SELECTORS]
+
+# Words that rule out a candidate being a person's name
+_NON_NAME_WORDS = frozenset({"the", "and", "of", "at", "for", "in", "on", "@", "&", "|"})
+_COMPANY_WORDS = frozenset({
+    "capital", "management", "labs", "ventures", "partners", "group",
+    "inc", "corp", "llc", "ltd", "foundation", "fund", "bank", "finance",
+    "consulting", "advisory", "holdings", "investments", "asset", "assets",
+    "digital", "crypto", "blockchain", "network", "protocol", "exchange",
+    "technology", "technologies", "solutions", "services", "global",
+    "international", "institute", "association", "council", "chamber",
+})
+_NOT_NAME_WORDS = _NON_NAME_WORDS | _COMPANY_WORDS
+
+# Tags scanned for a name when no name selector matches, and for loose text
+_HEADING_TAGS = frozenset({"h2", "h3", "h4", "strong", "b"})
+_TEXT_TAGS = frozenset({"p", "span", "div"})
+
+# Containers the fallback detector considers as card candidates
+_FALLBACK_CONTAINER_TAGS = frozenset({"div", "article", "li", "section"})
+
 
 def scrape_speakers(url: str) -> list[Speaker]:
     """
@@ -535,35 +648,14 @@ def scrape_speakers(url: str) -> list[Speaker]:
     logger.info(f"Scraping speakers from: {url}")
 
     # Check for site-specific scrapers
-    if "coindesk.com" in url:
-        from scrapers.consensus_scraper import scrape_consensus_speakers
-        speakers = scrape_consensus_speakers(url)
-        if speakers:
-            return speakers
-
-    if "dcblockchainsummit.com" in url:
-        from scrapers.dcblockchainsummit_scraper import scrape_dcblockchainsummit_speakers
-        speakers = scrape_dcblockchainsummit_speakers(url)
-        if speakers:
-            return speakers
-
-    if "btcprague.com" in url:
-        from scrapers.btcprague_scraper import scrape_btcprague_speakers
-        speakers = scrape_btcprague_speakers(url)
-        if speakers:
-            return speakers
-
-    if "ethdenver.com" in url:
-        from scrapers.ethdenver_scraper import scrape_ethdenver_speakers
-        speakers = scrape_ethdenver_speakers(url)
-        if speakers:
-            return speakers
-
-    if "web3hubdavos.com" in url:
-        from scrapers.web3hubdavos_scraper import scrape_web3hubdavos_speakers
-        speakers = scrape_web3hubdavos_speakers(url)
-        if speakers:
-            return speakers
+    host = urlparse(url).netloc.lower().removeprefix("www.")
+    for suffix, (module_name, func_name) in _SITE_SCRAPERS.items():
+        if host == suffix or host.endswith("." + suffix):
+            site_scraper = getattr(importlib.import_module(module_name), func_name)
+            speakers = site_scraper(url)
+            if speakers:
+                return speakers
+            break
 
     # Use realistic browser headers to avoid blocks
     headers = {
@@ -573,56 +665,44 @@ def scrape_speakers(url: str) -> list[Speaker]:
     }
 
     try:
-        session = requests.Session()
+        session = get_session()
         response = session.get(url, headers=headers, timeout=30, allow_redirects=True)
         response.raise_for_status()
     except requests.RequestException as e:
         logger.error(f"Failed to fetch URL: {e}")
         return []
 
+    # Work on the raw bytes: the parser decodes them itself, so the body is
+    # never decoded (and charset-sniffed) a second time via response.text
+    html = response.content
+
     # Try Next.js data extraction first (for React-based sites)
-    nextjs_speakers = _extract_nextjs_speakers(response.text, url)
+    nextjs_speakers = _extract_nextjs_speakers(html, url)
     if nextjs_speakers:
         logger.info(f"Extracted {len(nextjs_speakers)} speakers from Next.js data")
         return nextjs_speakers
 
-    soup = BeautifulSoup(response.text, "html.parser")
-    speakers = []
+    soup = BeautifulSoup(html, HTML_PARSER, from_encoding=_declared_encoding(response))
 
     # Try each selector pattern to find speaker cards
-    speaker_cards = []
-    for selector in SPEAKER_SELECTORS:
-        try:
-            cards = soup.select(selector)
-            if cards:
-                logger.debug(f"Found {len(cards)} elements with selector: {selector}")
-                speaker_cards = cards
-                break
-        except Exception:
-            continue
+    speaker_cards = _select_speaker_cards(soup)
 
     if not speaker_cards:
         logger.warning("No speaker cards found with standard selectors. Trying fallback...")
         speaker_cards = _fallback_speaker_detection(soup)
 
+    # Extract speakers, deduplicating by name as they are found
+    by_name = {}
     for card in speaker_cards:
         speaker = _extract_speaker_from_card(card, url)
         if speaker and speaker.name:
-            speakers.append(speaker)
-
-    # Deduplicate by name
-    seen_names = set()
-    unique_speakers = []
-    for speaker in speakers:
-        normalized_name = speaker.name.lower().strip()
-        if normalized_name not in seen_names:
-            seen_names.add(normalized_name)
-            unique_speakers.append(speaker)
+            by_name.setdefault(speaker.name.lower().strip(), speaker)
+    unique_speakers = list(by_name.values())
 
     # Check if page might have more content (JS-rendered with infinite scroll)
     # Indicators: few speakers found, or page has script tags suggesting React/Next.js
-    is_js_heavy = "__NEXT" in response.text or "react" in response.text.lower() or "firebase" in response.text.lower()
-    has_pagination = 'rel="next"' in response.text or "/page/2" in response.text
+    is_js_heavy = _JS_HEAVY_RE.search(html) is not None
+    has_pagination = b'rel="next"' in html or b"/page/2" in html
 
     # If few speakers or JS-heavy page, try additional extraction methods
     if len(unique_speakers) <= 50 or (is_js_heavy and len(unique_speakers) < 100):
@@ -654,30 +734,52 @@ def scrape_speakers(url: str) -> list[Speaker]:
     return unique_speakers
 
 
+def _stripped_text_length(element, limit: int) -> int:
+    """Length of element.get_text(strip=True), counting only up to limit."""
+    length = 0
+    for text in element.stripped_strings:
+        length += len(text)
+        if length >= limit:
+            break
+    return length
+
+
 def _fallback_speaker_detection(soup: BeautifulSoup) -> list:
     """
     Fallback detection for non-standard speaker layouts.
     Looks for repeated structures with person-like content.
     """
-    candidates = []
-
-    # Look for divs/articles with images and text that could be speakers
-    for container in soup.find_all(["div", "article", "li", "section"]):
-        # Check if it has an image and some text
-        has_image = container.find("img") is not None
-        text_content = container.get_text(strip=True)
+    checked = set()
+
+    # Speaker cards carry an image, so walk up from each image instead of
+    # testing every div/article/li/section on the page
+    for img in soup.find_all("img"):
+        # Heuristic: speaker cards usually have 20-500 chars of text. Text only
+        # grows going up, so stop at the first ancestor past 500 chars (or one
+        # an earlier image already walked through).
+        cards = []
+        for container in img.parents:
+            if container.name not in _FALLBACK_CONTAINER_TAGS:
+                continue
+            if id(container) in checked:
+                break
+            checked.add(id(container))
+            text_length = _stripped_text_length(container, limit=500)
+            if text_length >= 500:
+                break
+            if text_length > 20:
+                cards.append(container)
 
-        # Heuristic: speaker cards usually have 20-500 chars of text
-        if has_image and 20 < len(text_content) < 500:
+        # Outermost first, matching document order
+        for container in reversed(cards):
             # Check if parent has multiple similar children (grid pattern)
             parent = container.parent
             if parent:
                 siblings = parent.find_all(container.name, recursive=False)
                 if len(siblings) >= 3:  # Likely a speaker grid
-                    candidates.extend(siblings)
-                    break
+                    return siblings
 
-    return candidates
+    return []
 
 
 def _extract_speaker_from_card(card, source_url: str) -> Optional[Speaker]:
@@ -687,7 +789,7 @@ def _extract_speaker_from_card(card, source_url: str) -> Optional[Speaker]:
     company = None
 
     # Check if this is an Elementor column (WordPress page builder)
-    is_elementor = any("elementor" in c for c in card.get("class", []))
+    is_elementor = "elementor" in " ".join(card.get("class") or ())
 
     if is_elementor:
         # Elementor pattern: H2[0] = Name, Text widget = Title, H2[1] = Company
@@ -695,8 +797,8 @@ def _extract_speaker_from_card(card, source_url: str) -> Optional[Speaker]:
         h2_texts = [h.get_text(strip=True).rstrip("\u200b") for h in h2_elements]
 
         # Get text widget content (job titles)
-        text_widgets = card.select(".elementor-widget-text-editor")
-        widget_texts = [w.get_text(strip=True) for w in text_widgets if w.get_text(strip=True)]
+        text_widgets = _TEXT_WIDGET_SIEVE.select(card)
+        widget_texts = [t for t in (w.get_text(strip=True) for w in text_widgets) if t]
 
         # First H2 is always the name
         if h2_texts:
@@ -720,24 +822,54 @@ def _extract_speaker_from_card(card, source_url: str) -> Optional[Speaker]:
             source_url=source_url
         )
 
-    # Standard extraction for non-Elementor sites
-    # Extract name
-    for selector in NAME_SELECTORS:
-        try:
-            elem = card.select_one(selector)
-            if elem:
-                text = elem.get_text(strip=True)
-                # Name should be 2-50 chars and look like a name
-                if 2 < len(text) < 50 and _looks_like_name(text):
-                    name = text
-                    break
-        except Exception:
+    # Standard extraction for non-Elementor sites: walk the card once,
+    # recording the first match of every name/title/company selector
+    name_hits = [None] * len(_NAME_MATCHERS)
+    title_hits = [None] * len(_TITLE_MATCHERS)
+    company_hits = [None] * len(_COMPANY_MATCHERS)
+    headings = []
+    text_elems = []
+    for elem in card.descendants:
+        if not isinstance(elem, Tag):
             continue
+        tag = elem.name
+        classes = elem.get("class") or []
+        class_str = " ".join(classes)
+        for hits, matchers in (
+            (name_hits, _NAME_MATCHERS),
+            (title_hits, _TITLE_MATCHERS),
+            (company_hits, _COMPANY_MATCHERS),
+        ):
+            for i, matches in enumerate(matchers):
+                if hits[i] is None and matches(tag, classes, class_str):
+                    hits[i] = elem
+        if tag in _HEADING_TAGS:
+            headings.append(elem)
+        elif tag in _TEXT_TAGS:
+            text_elems.append(elem)
+
+    # The same element is often hit by several selectors; get its text once
+    texts = {}
+
+    def text_of(elem) -> str:
+        text = texts.get(id(elem))
+        if text is None:
+            text = texts[id(elem)] = elem.get_text(strip=True)
+        return text
+
+    # Extract name
+    for elem in name_hits:
+        if elem:
+            text = text_of(elem)
+            # Name should be 2-50 chars and look like a name
+            if 2 < len(text) < 50 and _looks_like_name(text):
+                name = text
+                break
 
     # If no name found via selectors, try first significant text
     if not name:
-        for elem in card.find_all(["h2", "h3", "h4", "strong", "b"]):
-            text = elem.get_text(strip=True)
+        for elem in headings:
+            text = text_of(elem)
             if 2 < len(text) < 50 and _looks_like_name(text):
                 name = text
                 break
@@ -745,46 +877,39 @@ def _extract_speaker_from_card(card, source_url: str) -> Optional[Speaker]:
     if not name:
         return None
 
-    # Extract title and company
-    all_text_parts = []
-    for elem in card.find_all(["p", "span", "div"]):
-        text = elem.get_text(strip=True)
-        if text and text != name and len(text) < 200:
-            all_text_parts.append(text)
-
     # Try specific selectors for title
-    for selector in TITLE_SELECTORS:
-        try:
-            elem = card.select_one(selector)
-            if elem:
-                text = elem.get_text(strip=True)
-                if text and text != name and len(text) < 100:
-                    title = text
-                    break
-        except Exception:
-            continue
+    for elem in title_hits:
+        if elem:
+            text = text_of(elem)
+            if text and text != name and len(text) < 100:
+                title = text
+                break
 
     # Try specific selectors for company
-    for selector in COMPANY_SELECTORS:
-        try:
-            elem = card.select_one(selector)
-            if elem:
-                text = elem.get_text(strip=True)
-                if text and text != name and text != title:
-                    company = text
-                    break
-        except Exception:
-            continue
+    for elem in company_hits:
+        if elem:
+            text = text_of(elem)
+            if text and text != name and text != title:
+                company = text
+                break
 
     # If no explicit company, try to parse from title (common format: "CEO at Company")
     if not company and title:
         company = _extract_company_from_title(title)
 
     # If still no title/company, use first text parts
-    if not title and all_text_parts:
-        title = all_text_parts[0]
-    if not company and len(all_text_parts) > 1:
-        company = all_text_parts[1]
+    if not title or not company:
+        all_text_parts = []
+        for elem in text_elems:
+            text = text_of(elem)
+            if text and text != name and len(text) < 200:
+                all_text_parts.append(text)
+                if len(all_text_parts) > 1:
+                    break
+        if not title and all_text_parts:
+            title = all_text_parts[0]
+        if not company and len(all_text_parts) > 1:
+            company = all_text_parts[1]
 
     return Speaker(
         name=name,
@@ -794,8 +919,13 @@ def _extract_speaker_from_card(card, source_url: str) -> Optional[Speaker]:
     )
 
 
+@functools.lru_cache(maxsize=4096)
 def _looks_like_name(text: str) -> bool:
-    """Check if text looks like a person's name."""
+    """Check if text looks like a person's name (cached: cards repeat text)."""
+    # Should start with capital letter (cheapest test first)
+    if not text or not text[0].isupper():
+        return False
+
     # Should have at least 2 words (first + last name)
     words = text.split()
     if len(words) < 2:
@@ -805,41 +935,22 @@ def _looks_like_name(text: str) -> bool:
     if len(words) > 5:
         return False
 
-    # Should not contain common non-name words
-    non_name_words = ["the", "and", "of", "at", "for", "in", "on", "@", "&", "|"]
-    if any(w.lower() in non_name_words for w in words):
-        return False
-
-    # Should not contain company-related words
-    company_words = [
-        "capital", "management", "labs", "ventures", "partners", "group",
-        "inc", "corp", "llc", "ltd", "foundation", "fund", "bank", "finance",
-        "consulting", "advisory", "holdings", "investments", "asset", "assets",
-        "digital", "crypto", "blockchain", "network", "protocol", "exchange",
-        "technology", "technologies", "solutions", "services", "global",
-        "international", "institute", "association", "council", "chamber",
-    ]
-    if any(w.lower() in company_words for w in words):
-        return False
-
-    # Should start with capital letter
-    if not text[0].isupper():
+    # Should not contain common non-name words or company-related words
+    if not _NOT_NAME_WORDS.isdisjoint(w.lower() for w in words):
         return False
 
     return True
 
 
+@functools.lru_cache(maxsize=2048)
 def _extract_company_from_title(title: str) -> Optional[str]:
     """Extract company name from title like 'CEO at Company' or 'CEO, Company'."""
-    patterns = [
-        r"(?:at|@)\s+(.+)$",           # "CEO at Company"
-        r",\s+(.+)$",                   # "CEO, Company"
-        r"\|\s*(.+)$",                  # "CEO | Company"
-        r"-\s+(.+)$",                   # "CEO - Company"
-    ]
+    # Every pattern needs one of these delimiters; most plain titles have none
+    if not any(c in title for c in ",|-@") and "at" not in title.lower():
+        return None
 
-    for pattern in patterns:
-        match = re.search(pattern, title, re.IGNORECASE)
+    for pattern in _TITLE_COMPANY_RES:
+        match = pattern.search(title)
         if match:
             return match.group(1).strip()
 
@@ -0,0 +1,43 @@
+"""Social profile link extraction shared by the scrapers."""
+
+import re
+from typing import Iterable, Optional
+
+from bs4 import Tag
+
+# Matches the host of Twitter/X and LinkedIn URLs (not e.g. "fedex.com")
+SOCIAL_LINK_RE = re.compile(r"(?://|\.)(twitter\.com|x\.com|linkedin\.com)/")
+
+
+def pick_social_urls(urls: Iterable[str]) -> tuple[Optional[str], Optional[str]]:
+    """
+    Return the first (twitter_url, linkedin_url) among urls.
+
+    Stops consuming urls as soon as both have been found.
+    """
+    twitter_url = None
+    linkedin_url = None
+    for url in urls:
+        match = SOCIAL_LINK_RE.search(url)
+        if not match:
+            continue
+        if match.group(1) == "linkedin.com":
+            linkedin_url = linkedin_url or url.strip()
+        else:
+            twitter_url = twitter_url or url.strip()
+        if twitter_url and linkedin_url:
+            break
+    return twitter_url, linkedin_url
+
+
+def extract_social_links(element) -> tuple[Optional[str], Optional[str]]:
+    """
+    Return the first (twitter_url, linkedin_url) linked inside element.
+
+    Links are walked lazily, so the walk ends once both have been found.
+    """
+    hrefs = (
+        node["href"] for node in element.descendants
+        if isinstance(node, Tag) and node.name == "a" and node.get("href") is not None
+    )
+    return pick_social_urls(hrefs)
@@ -2,19 +2,137 @@
 
 import logging
 import re
-import time
 from typing import Optional
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+
 from models import Speaker
+from scrapers.browser import PLAYWRIGHT_AVAILABLE, page_context, wait_for_idle
 
 logger = logging.getLogger(__name__)
 
+# lxml streams card text without building a tree; html.parser is the fallback
 try:
-    from playwright.sync_api import sync_playwright
-    PLAYWRIGHT_AVAILABLE = True
+    from lxml import etree
+    LXML_AVAILABLE = True
+    HTML_PARSER = "lxml"
 except ImportError:
-    PLAYWRIGHT_AVAILABLE = False
+    LXML_AVAILABLE = False
+    HTML_PARSER = "html.parser"
+
+# Section headers and page chrome that share the card markup
+_SKIP_TEXTS = ("become a speaker", "stay updated", "speakers", "web3 hub davos",
+               "meet our", "all speakers", "2026 speakers", "2025 speakers")
+_SKIP_RE = re.compile("|".join(map(re.escape, _SKIP_TEXTS)), re.IGNORECASE)
+
+# A lone second line containing one of these is a job title, not a company
+_TITLE_KEYWORDS = ("ceo", "founder", "head", "director", "chief", "partner",
+                   "chairman", "president", "manager", "officer")
+_TITLE_KEYWORD_RE = re.compile("|".join(_TITLE_KEYWORDS), re.IGNORECASE)
+
+# Splits stripped card text into trimmed, non-empty lines
+_LINE_SPLIT_RE = re.compile(r"\s*\n\s*")
+
+# Clicks 'Load more' inside the page until it disappears or stops adding
+# cards, in one round trip; each click waits only as long as the new cards take
+_LOAD_ALL_JS = """async ([maxClicks, timeout]) => {
+    const count = () => document.querySelectorAll('a[href="#"]').length;
+    let clicks = 0;
+    while (clicks < maxClicks) {
+        const btn = [...document.querySelectorAll('button, a, [role="button"]')]
+            .find(e => /load more/i.test(e.textContent) && e.offsetParent !== null);
+        if (!btn) break;
+        const before = count();
+        btn.click();
+        clicks++;
+        const deadline = Date.now() + timeout;
+        while (count() <= before && Date.now() < deadline) {
+            await new Promise(r => setTimeout(r, 100));
+        }
+        if (count() <= before) break;
+    }
+    return clicks;
+}"""
+
+# Text inside these never shows up in get_text()
+_NON_TEXT_TAGS = frozenset({"script", "style", "template"})
+
+
+class _CardTextCollector:
+    """
+    lxml parser target that collects the text of each <a href="#"> card.
+
+    Each card's text matches get_text(separator="\\n", strip=True), but no
+    tree is built for the page.
+    """
+
+    def __init__(self):
+        self.cards: list[str] = []
+        self._depth = 0  # Open elements inside the current card; 0 = outside
+        self._skip_depth = 0  # Open script/style elements inside the card
+        self._strings: list[str] = []
+        self._buffer: list[str] = []
+
+    def _flush(self) -> None:
+        if self._buffer:
+            text = "".join(self._buffer).strip()
+            if text:
+                self._strings.append(text)
+            self._buffer = []
+
+    def start(self, tag, attrib) -> None:
+        if self._depth:
+            self._flush()
+            self._depth += 1
+            if tag in _NON_TEXT_TAGS:
+                self._skip_depth += 1
+        elif tag == "a" and attrib.get("href") == "#":
+            self._depth = 1
+
+    def end(self, tag) -> None:
+        if not self._depth:
+            return
+        self._flush()
+        self._depth -= 1
+        if tag in _NON_TEXT_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+        if not self._depth:
+            self.cards.append("\n".join(self._strings))
+            self._strings = []
+
+    def data(self, data) -> None:
+        if self._depth and not self._skip_depth:
+            self._buffer.append(data)
+
+    def comment(self, text) -> None:
+        if self._depth:
+            self._flush()
+
+    def close(self) -> list[str]:
+        return self.cards
+
+
+def _card_texts(html: str) -> list[str]:
+    """Text of every <a href="#"> card, streamed through lxml without a DOM."""
+    if not LXML_AVAILABLE:
+        soup = BeautifulSoup(html, HTML_PARSER, parse_only=SoupStrainer("a", href="#"))
+        return [a.get_text(separator="\n", strip=True) for a in soup.find_all("a", href="#")]
+
+    parser = etree.HTMLParser(target=_CardTextCollector())
+    parser.feed(html)
+    return parser.close()
+
+
+def _short_text(element, limit: int) -> Optional[str]:
+    """element.get_text(strip=True), or None once it reaches limit chars."""
+    parts = []
+    length = 0
+    for text in element.stripped_strings:
+        length += len(text)
+        if length >= limit:
+            return None
+        parts.append(text)
+    return "".join(parts)
 
 
 def scrape_web3hubdavos_speakers(url: str) -> list[Speaker]:
@@ -29,64 +147,41 @@ def scrape_web3hubdavos_speakers(url: str) -> list[Speaker]:
 
     logger.info(f"Scraping Web3 Hub Davos speakers from: {url}")
 
-    speakers = []
-    seen = set()
+    # Speakers keyed by lowercased name; first occurrence wins
+    by_name: dict[str, Speaker] = {}
 
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
+        with page_context(block_resources=True) as page:
             page.goto(url, wait_until="domcontentloaded", timeout=90000)
-            time.sleep(5)  # Wait for JS
+            # Long-polling widgets can keep the network busy; the grid is rendered by then
+            wait_for_idle(page, timeout=30000)
 
             # Click 'Load more' until all speakers loaded
-            clicks = 0
-            for i in range(30):
-                try:
-                    more_btn = page.locator("text=/load more/i").first
-                    if more_btn.is_visible():
-                        more_btn.click()
-                        clicks += 1
-                        time.sleep(1.5)
-                    else:
-                        break
-                except Exception:
-                    break
-
+            clicks = page.evaluate(_LOAD_ALL_JS, [30, 5000])
             logger.info(f"Clicked 'Load more' {clicks} times")
 
             # Get full HTML for parsing
             html = page.content()
-            browser.close()
 
     except Exception as e:
         logger.error(f"Failed to load page: {e}")
         return []
 
-    soup = BeautifulSoup(html, "html.parser")
-
     # Find speaker cards - they contain name, title, and company in structured way
     # Looking for links with speaker-thumb images and text data
-    skip_texts = ["become a speaker", "stay updated", "speakers", "web3 hub davos",
-                  "meet our", "all speakers", "2026 speakers", "2025 speakers"]
-
     # Find all speaker grid items or card containers
     # The speakers appear to be in anchor tags with image + text structure
-    speaker_links = soup.find_all("a", href="#")
-
-    for link in speaker_links:
+    for text in _card_texts(html):
         try:
-            # Get all text content
-            text = link.get_text(separator="\n", strip=True)
             if not text or len(text) < 5:
                 continue
 
             # Skip section headers
-            if any(s in text.lower() for s in skip_texts):
+            if _SKIP_RE.search(text):
                 continue
 
             # Parse the structured text (Name, Title, Company format)
-            lines = [line.strip() for line in text.split("\n") if line.strip()]
+            lines = _LINE_SPLIT_RE.split(text)
             if len(lines) < 2:
                 continue
 
@@ -94,7 +189,8 @@ def scrape_web3hubdavos_speakers(url: str) -> list[Speaker]:
             name = lines[0].strip()
             if not name or len(name) < 2:
                 continue
-            if name.lower() in seen:
+            name_lower = name.lower()
+            if name_lower in by_name:
                 continue
 
             # Second line is typically title, third is company
@@ -109,34 +205,36 @@ def scrape_web3hubdavos_speakers(url: str) -> list[Speaker]:
                 # Could be "Title Company" or just one of them
                 second = lines[1].strip()
                 # Try to detect if it looks like a company (common patterns)
-                if any(kw in second.lower() for kw in ["ceo", "founder", "head", "director", "chief", "partner", "chairman", "president", "manager", "officer"]):
+                if _TITLE_KEYWORD_RE.search(second):
                     title = second
                 else:
                     company = second
 
-            seen.add(name.lower())
-            speakers.append(Speaker(
+            by_name[name_lower] = Speaker(
                 name=name,
                 title=title,
                 company=company,
                 source_url=url
-            ))
+            )
 
         except Exception:
             continue
 
     # Also try parsing H2 elements with adjacent text
-    if len(speakers) < 10:
+    if len(by_name) < 10:
         logger.info("Few speakers from link parsing, trying H2 approach...")
+        # H2 siblings can be any tag, so this path needs the full document
+        soup = BeautifulSoup(html, HTML_PARSER)
         h2s = soup.find_all("h2")
 
         for h2 in h2s:
             name = h2.get_text(strip=True)
             if not name or len(name) < 2:
                 continue
-            if any(s in name.lower() for s in skip_texts):
+            if _SKIP_RE.search(name):
                 continue
-            if name.lower() in seen:
+            name_lower = name.lower()
+            if name_lower in by_name:
                 continue
 
             # Look for title/company in parent or adjacent elements
@@ -144,23 +242,25 @@ def scrape_web3hubdavos_speakers(url: str) -> list[Speaker]:
             company = ""
             parent = h2.parent
             if parent:
-                # Get text from sibling elements
-                for sibling in h2.find_next_siblings():
-                    text = sibling.get_text(strip=True)
-                    if text and text != name and len(text) > 2 and len(text) < 150:
+                # Get text from sibling elements (lazily; usually the first two suffice)
+                for sibling in h2.next_siblings:
+                    if not isinstance(sibling, Tag):
+                        continue
+                    text = _short_text(sibling, 150)
+                    if text and text != name and len(text) > 2:
                         if not title:
                             title = text
                         elif not company:
                             company = text
                             break
 
-            seen.add(name.lower())
-            speakers.append(Speaker(
+            by_name[name_lower] = Speaker(
                 name=name,
                 title=title,
                 company=company,
                 source_url=url
-            ))
+            )
 
+    speakers = list(by_name.values())
     logger.info(f"Extracted {len(speakers)} speakers from Web3 Hub Davos")
     return speakers